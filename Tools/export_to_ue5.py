@@ -6,402 +6,363 @@ This script converts game JSON data to CSV format for UE5 Data Table import.
 Also generates UE5 struct definitions for C++ integration.
 
 Usage:
-    python export_to_ue5.py [--output-dir OUTPUT] [--format csv|json]
+    python export_to_ue5.py [--output-dir OUTPUT] [--format csv|json|parquet|feather]
 """
 
+import gzip
+import io
 import json
-import csv
+import mmap
 import os
+import re
 import sys
 import argparse
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib parser
+    orjson = None
 
-@dataclass
-class ExportConfig:
-    output_dir: Path
-    format: str  # 'csv' or 'json'
-    generate_structs: bool
-
-
-class UE5Exporter:
-    """Export game data to UE5-compatible formats."""
-
-    def __init__(self, data_path: str, config: ExportConfig):
-        self.data_path = Path(data_path)
-        self.config = config
-        self.exported_files: List[str] = []
-
-    def ensure_output_dir(self):
-        """Create output directory if it doesn't exist."""
-        self.config.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def load_json(self, file_path: Path) -> Optional[Dict]:
-        """Load a JSON file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading {file_path}: {e}")
-            return None
-
-    def flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
-        """Flatten nested dictionary for CSV export."""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self.flatten_dict(v, new_key, sep).items())
-            elif isinstance(v, list):
-                # Convert list to JSON string for CSV
-                items.append((new_key, json.dumps(v)))
-            else:
-                items.append((new_key, v))
-        return dict(items)
-
-    def export_items(self):
-        """Export items to UE5 Data Table format."""
-        items_file = self.data_path / "Items" / "items.json"
-        if not items_file.exists():
-            print("Items file not found, skipping...")
-            return
-
-        data = self.load_json(items_file)
-        if not data:
-            return
-
-        items = data.get('items', [])
-
-        # Prepare CSV data
-        csv_rows = []
-        for item in items:
-            row = {
-                'RowName': item.get('id', ''),
-                'Name': item.get('name', ''),
-                'Description': item.get('description', ''),
-                'Type': item.get('type', ''),
-                'Slot': item.get('slot', ''),
-                'Stackable': str(item.get('stackable', False)).lower(),
-                'MaxStack': item.get('maxStack', 1),
-                'Tradeable': str(item.get('tradeable', True)).lower(),
-                'Value': item.get('value', 0),
-                'Weight': item.get('weight', 0.0),
-                'Requirements': json.dumps(item.get('requirements', {})),
-                'Stats': json.dumps(item.get('stats', {})),
-                'Effects': json.dumps(item.get('effects', [])),
-            }
-            csv_rows.append(row)
-
-        self._write_csv('DT_Items', csv_rows)
-        print(f"Exported {len(csv_rows)} items")
-
-    def export_enemies(self):
-        """Export enemies to UE5 Data Table format."""
-        enemies_file = self.data_path / "Npcs" / "enemies.json"
-        if not enemies_file.exists():
-            print("Enemies file not found, skipping...")
-            return
 
-        data = self.load_json(enemies_file)
-        if not data:
-            return
-
-        # Export regular enemies
-        csv_rows = []
-        for enemy in data.get('enemies', []):
-            row = {
-                'RowName': enemy.get('id', ''),
-                'Name': enemy.get('name', ''),
-                'Description': enemy.get('description', ''),
-                'Category': enemy.get('category', ''),
-                'Level': enemy.get('level', 1),
-                'CombatLevel': enemy.get('combatLevel', 1),
-                'Health': enemy.get('health', 100),
-                'AttackStyle': enemy.get('attackStyle', 'melee'),
-                'Aggressive': str(enemy.get('aggressive', False)).lower(),
-                'RespawnTime': enemy.get('respawnTime', 60),
-                'Zones': json.dumps(enemy.get('zones', [])),
-                'Stats': json.dumps(enemy.get('stats', {})),
-                'Abilities': json.dumps(enemy.get('abilities', [])),
-                'LootTableRef': enemy.get('lootTableRef', ''),
-                'BeastslayerLevel': enemy.get('beastslayerLevel', 0),
-                'Immunities': json.dumps(enemy.get('immunities', [])),
-                'Weaknesses': json.dumps(enemy.get('weaknesses', [])),
-            }
-            csv_rows.append(row)
-
-        self._write_csv('DT_Enemies', csv_rows)
-        print(f"Exported {len(csv_rows)} enemies")
+if orjson is not None:
+    def _load_file(path: Path) -> Any:
+        """Parse a JSON file directly from a read-only memory map."""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b'')  # mmap rejects empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
 
-        # Export world bosses
-        boss_rows = []
-        for boss in data.get('worldBosses', []) + data.get('dungeonBosses', []):
-            row = {
-                'RowName': boss.get('id', ''),
-                'Name': boss.get('name', ''),
-                'Description': boss.get('description', ''),
-                'Category': boss.get('category', ''),
-                'Level': boss.get('level', 1),
-                'CombatLevel': boss.get('combatLevel', 1),
-                'Health': boss.get('health', 1000),
-                'Phases': boss.get('phases', 1),
-                'AttackStyles': json.dumps(boss.get('attackStyles', [])),
-                'Zone': boss.get('zone', ''),
-                'Stats': json.dumps(boss.get('stats', {})),
-                'Abilities': json.dumps(boss.get('abilities', [])),
-                'LootTableRef': boss.get('lootTableRef', ''),
-                'MinPlayers': boss.get('minPlayers', 1),
-                'Requirements': json.dumps(boss.get('requirements', {})),
-            }
-            boss_rows.append(row)
-
-        if boss_rows:
-            self._write_csv('DT_Bosses', boss_rows)
-            print(f"Exported {len(boss_rows)} bosses")
+    def _dumps(value: Any) -> str:
+        """Serialize a nested field to a compact JSON string for a CSV cell."""
+        return orjson.dumps(value).decode('utf-8')
+else:
+    def _load_file(path: Path) -> Any:
+        return json.loads(path.read_bytes())
 
-    def export_abilities(self):
-        """Export abilities to UE5 Data Table format."""
-        abilities_file = self.data_path / "Combat" / "abilities.json"
-        if not abilities_file.exists():
-            print("Abilities file not found, skipping...")
-            return
-
-        data = self.load_json(abilities_file)
-        if not data:
-            return
-
-        csv_rows = []
-        for category in ['melee', 'ranged', 'magic', 'defense', 'prayer']:
-            for ability in data.get(category, []):
-                row = {
-                    'RowName': ability.get('id', ''),
-                    'Name': ability.get('name', ''),
-                    'Description': ability.get('description', ''),
-                    'Category': category,
-                    'Type': ability.get('type', 'basic'),
-                    'LevelRequired': ability.get('levelRequired', 1),
-                    'Cooldown': ability.get('cooldown', 0),
-                    'AdrenalineCost': ability.get('adrenalineCost', 0),
-                    'AdrenalineGain': ability.get('adrenalineGain', 0),
-                    'ManaCost': ability.get('manaCost', 0),
-                    'PrayerDrain': ability.get('prayerDrain', 0),
-                    'DamageType': ability.get('damageType', 'physical'),
-                    'BaseDamage': ability.get('baseDamage', 0),
-                    'DamageMultiplier': ability.get('damageMultiplier', 1.0),
-                    'Duration': ability.get('duration', 0),
-                    'Effects': json.dumps(ability.get('effects', [])),
-                    'Animation': ability.get('animation', ''),
-                    'VFX': ability.get('vfx', ''),
-                    'SFX': ability.get('sfx', ''),
-                }
-                csv_rows.append(row)
-
-        self._write_csv('DT_Abilities', csv_rows)
-        print(f"Exported {len(csv_rows)} abilities")
-
-    def export_zones(self):
-        """Export zones to UE5 Data Table format."""
-        zones_file = self.data_path / "World" / "zones.json"
-        if not zones_file.exists():
-            print("Zones file not found, skipping...")
-            return
-
-        data = self.load_json(zones_file)
-        if not data:
-            return
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
 
-        csv_rows = []
-        for region in data.get('regions', []):
-            for zone in region.get('zones', []):
-                row = {
-                    'RowName': zone.get('id', ''),
-                    'Name': zone.get('name', ''),
-                    'Description': zone.get('description', ''),
-                    'Region': region.get('name', ''),
-                    'RegionId': region.get('id', ''),
-                    'LevelRange': json.dumps(zone.get('levelRange', {})),
-                    'Type': zone.get('type', 'open_world'),
-                    'PvpEnabled': str(zone.get('pvpEnabled', False)).lower(),
-                    'Connections': json.dumps(zone.get('connections', [])),
-                    'SpawnPoints': json.dumps(zone.get('spawnPoints', [])),
-                    'Bounds': json.dumps(zone.get('bounds', {})),
-                    'Resources': json.dumps(zone.get('resources', [])),
-                    'Enemies': json.dumps(zone.get('enemies', [])),
-                }
-                csv_rows.append(row)
-
-        self._write_csv('DT_Zones', csv_rows)
-        print(f"Exported {len(csv_rows)} zones")
 
-    def export_quests(self):
-        """Export quests to UE5 Data Table format."""
-        quests_file = self.data_path / "Quests" / "quests.json"
-        if not quests_file.exists():
-            print("Quests file not found, skipping...")
-            return
+@lru_cache(maxsize=4096)
+def _dumps_strings(values: Tuple[str, ...]) -> str:
+    return _dumps(values)
 
-        data = self.load_json(quests_file)
-        if not data:
-            return
 
-        csv_rows = []
-        for quest in data.get('quests', []):
-            row = {
-                'RowName': quest.get('id', ''),
-                'Name': quest.get('name', ''),
-                'Description': quest.get('description', ''),
-                'Difficulty': quest.get('difficulty', 'novice'),
-                'Length': quest.get('length', 'short'),
-                'StartNpc': quest.get('startNpc', ''),
-                'Requirements': json.dumps(quest.get('requirements', {})),
-                'Rewards': json.dumps(quest.get('rewards', {})),
-                'Objectives': json.dumps(quest.get('objectives', [])),
-                'QuestPoints': quest.get('questPoints', 1),
-                'Members': str(quest.get('members', False)).lower(),
-            }
-            csv_rows.append(row)
-
-        self._write_csv('DT_Quests', csv_rows)
-        print(f"Exported {len(csv_rows)} quests")
+def _dumps_list(values: Any) -> str:
+    """Serialize a list field, memoizing flat lists of strings.
 
-    def export_loot_tables(self):
-        """Export loot tables to UE5 format."""
-        loot_file = self.data_path / "Npcs" / "loot_tables.json"
-        if not loot_file.exists():
-            print("Loot tables file not found, skipping...")
-            return
+    Zone lists, immunities, attack styles and similar fields repeat across
+    many rows, so identical lists are only serialized once per run.
+    """
+    if isinstance(values, list) and all(type(v) is str for v in values):
+        return _dumps_strings(tuple(values))
+    return _dumps(values)
 
-        data = self.load_json(loot_file)
-        if not data:
-            return
 
-        # Export enemy loot tables
-        csv_rows = []
-        for table_id, table in data.get('enemyLootTables', {}).items():
-            row = {
-                'RowName': table_id,
-                'AlwaysDrops': json.dumps(table.get('alwaysDrops', [])),
-                'MainDrops': json.dumps(table.get('mainDrops', [])),
-                'UncommonDrops': json.dumps(table.get('uncommonDrops', [])),
-                'RareDrops': json.dumps(table.get('rareDrops', [])),
-                'BeastslayerOnly': str(table.get('beastslayerOnly', False)).lower(),
-                'BeastslayerLevel': table.get('beastslayerLevel', 0),
-            }
-            csv_rows.append(row)
-
-        self._write_csv('DT_LootTables', csv_rows)
-        print(f"Exported {len(csv_rows)} loot tables")
+# Characters that force a CSV cell to be quoted (csv.QUOTE_MINIMAL rules)
+_NEEDS_QUOTING = re.compile(r'[,"\r\n]').search
 
-        # Export shared pools
-        pool_rows = []
-        for pool_id, pool in data.get('sharedPools', {}).items():
-            row = {
-                'RowName': pool_id,
-                'Description': pool.get('description', ''),
-                'Items': json.dumps(pool.get('items', [])),
-            }
-            pool_rows.append(row)
-
-        if pool_rows:
-            self._write_csv('DT_LootPools', pool_rows)
-            print(f"Exported {len(pool_rows)} loot pools")
 
-    def export_recipes(self):
-        """Export all recipes to UE5 format."""
-        recipes_path = self.data_path / "Recipes"
-        if not recipes_path.exists():
-            print("Recipes directory not found, skipping...")
-            return
+def _csv_cell(value: Any) -> str:
+    """Render one value as a CSV cell, quoting only when required."""
+    if value is None:
+        return ''
+    text = value if type(value) is str else str(value)
+    if _NEEDS_QUOTING(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
 
-        all_recipes = []
-        for recipe_file in recipes_path.glob("*.json"):
-            data = self.load_json(recipe_file)
-            if not data:
-                continue
 
-            skill_name = recipe_file.stem
-            for category, recipes in data.items():
-                if not isinstance(recipes, list):
-                    continue
-
-                for recipe in recipes:
-                    if not isinstance(recipe, dict):
-                        continue
-
-                    row = {
-                        'RowName': recipe.get('id', ''),
-                        'Name': recipe.get('name', ''),
-                        'Skill': recipe.get('skill', skill_name),
-                        'Category': category,
-                        'Level': recipe.get('level', 1),
-                        'XP': recipe.get('xp', 0),
-                        'Duration': recipe.get('duration', 1),
-                        'Inputs': json.dumps(recipe.get('inputs', [])),
-                        'Outputs': json.dumps(recipe.get('outputs', [])),
-                        'Tool': recipe.get('tool', ''),
-                        'Facility': json.dumps(recipe.get('facility', [])),
-                    }
-                    all_recipes.append(row)
-
-        if all_recipes:
-            self._write_csv('DT_Recipes', all_recipes)
-            print(f"Exported {len(all_recipes)} recipes")
+def _csv_line(row: Tuple) -> str:
+    return ','.join(map(_csv_cell, row)) + '\r\n'
 
-    def export_achievements(self):
-        """Export achievements to UE5 format."""
-        achievements_file = self.data_path / "Achievements" / "achievements.json"
-        if not achievements_file.exists():
-            print("Achievements file not found, skipping...")
-            return
 
-        data = self.load_json(achievements_file)
-        if not data:
-            return
+# Output buffer for table files; large enough that a typical table is written
+# with a handful of syscalls instead of one per 8 KiB.
+WRITE_BUFFER_SIZE = 1 << 20
 
-        csv_rows = []
-        for achievement in data.get('achievements', []):
-            row = {
-                'RowName': achievement.get('id', ''),
-                'Name': achievement.get('name', ''),
-                'Description': achievement.get('description', ''),
-                'Category': achievement.get('category', ''),
-                'Tier': achievement.get('tier', 'easy'),
-                'Points': achievement.get('points', 0),
-                'Requirements': json.dumps(achievement.get('requirements', {})),
-                'Rewards': json.dumps(achievement.get('rewards', {})),
-            }
-            csv_rows.append(row)
-
-        self._write_csv('DT_Achievements', csv_rows)
-        print(f"Exported {len(csv_rows)} achievements")
-
-    def _write_csv(self, name: str, rows: List[Dict]):
-        """Write data to CSV file."""
-        if not rows:
-            return
+# Level 1 gets most of the size reduction on this repetitive text for a
+# fraction of the CPU cost of the default level 9.
+GZIP_COMPRESS_LEVEL = 1
 
-        output_file = self.config.output_dir / f"{name}.csv"
-        fieldnames = list(rows[0].keys())
+# Rows formatted per write; rows are streamed, so only this many are held
+WRITE_BATCH_ROWS = 1024
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+# Threads used to parse the per-skill recipe files; orjson releases the GIL
+# while parsing, so the files are decoded concurrently.
+RECIPE_LOAD_THREADS = 8
 
-        self.exported_files.append(str(output_file))
+# File suffix of the tables written for each --format
+TABLE_SUFFIXES = {
+    'csv': '.csv',
+    'json': '.csv',
+    'parquet': '.parquet',
+    'feather': '.feather',
+}
 
-    def generate_ue5_structs(self):
-        """Generate C++ struct definitions for UE5."""
-        structs_file = self.config.output_dir / "GameDataStructs.h"
+# export_* methods run by run_export; each reads its own source file(s) and
+# writes its own tables, so they are safe to run in separate processes.
+EXPORT_STEPS = (
+    'export_items',
+    'export_enemies',
+    'export_abilities',
+    'export_zones',
+    'export_quests',
+    'export_loot_tables',
+    'export_recipes',
+    'export_achievements',
+)
 
-        header = f"""// Auto-generated by export_to_ue5.py
-// Generated: {datetime.now().isoformat()}
-// DO NOT EDIT MANUALLY
 
-#pragma once
+@dataclass
+class ExportConfig:
+    output_dir: Path
+    format: str  # 'csv', 'json', or the pyarrow-backed 'parquet' / 'feather'
+    generate_structs: bool
+    jobs: int = 1  # worker processes for the export steps; 1 runs serially
+    force: bool = False  # re-export tables even if their sources are unchanged
+    gzip: bool = False  # write CSV tables as .csv.gz
+
+
+class Ctx(str):
+    """Column key or default supplied by the exporter rather than the record.
+
+    Used for values that come from the enclosing structure, such as the
+    ability category or the region a zone belongs to.
+    """
+
+
+# How each column kind renders the looked-up value
+_COLUMN_TEMPLATES = {
+    None: '{}',
+    'bool': "('true' if {} else 'false')",
+    'json': '_dumps({})',
+    'list': '_dumps_list({})',
+}
+
+_COLUMN_NAMESPACE = {'_dumps': _dumps, '_dumps_list': _dumps_list}
+
+
+def _column_source(key: Any, kind: Optional[str], default: Any) -> str:
+    """Source expression for one cell of a row built from record ``r``.
+
+    Present keys are read with a membership test and subscript rather than
+    ``r.get(key, default)``, and a constant default is rendered once here, so
+    a missing JSON field costs a string constant instead of building and
+    serializing an empty container on every row.
+    """
+    template = _COLUMN_TEMPLATES[kind]
+    if isinstance(key, Ctx):
+        return template.format(key)
+    if isinstance(default, Ctx):
+        fallback = template.format(default)
+    else:
+        fallback = repr(eval(template.format('value'), _COLUMN_NAMESPACE, {'value': default}))
+    return f"({template.format(f'r[{key!r}]')} if {key!r} in r else {fallback})"
+
+
+def _compile_row_builders(columns: Tuple[Tuple, ...], context: Tuple[str, ...]):
+    """Generate ``build_row(r, *context)`` and ``build_rows(records, *context)``.
+
+    The lookups for every column are inlined into a single tuple display.
+    ``build_rows`` wraps that display in a generator expression, so rows are
+    produced lazily as the table is written, without a Python-level call per
+    row.
+    """
+    params = ''.join(f', {name}' for name in context)
+    cells = ''.join(f"\n        {_column_source(key, kind, default)},"
+                    for _, key, kind, default in columns)
+    source = (
+        f"def build_row(r{params}):\n"
+        f"    return ({cells}\n    )\n"
+        f"\n"
+        f"def build_rows(records{params}):\n"
+        f"    return (({cells}\n    ) for r in records)\n"
+    )
+    namespace = dict(_COLUMN_NAMESPACE)
+    exec(source, namespace)
+    return namespace['build_row'], namespace['build_rows']
+
+
+class TableSpec:
+    """Column layout of one UE5 Data Table.
+
+    Each column is ``(name, key, kind, default)``: the record is read with
+    ``record.get(key, default)`` and rendered according to ``kind`` (None for
+    the raw value, 'bool', 'json' or 'list').
+    """
+
+    def __init__(self, name: str, columns: Tuple[Tuple, ...], context: Tuple[str, ...] = ()):
+        self.name = name
+        self.columns = columns
+        self.context = context
+        # Interned once here and shared by every export run in the process
+        self.fieldnames = tuple(sys.intern(column[0]) for column in columns)
+        self.header = _csv_line(self.fieldnames)
+        self.build_row, self.rows = _compile_row_builders(columns, context)
+
+
+ITEMS_TABLE = TableSpec('DT_Items', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Type', 'type', None, ''),
+    ('Slot', 'slot', None, ''),
+    ('Stackable', 'stackable', 'bool', False),
+    ('MaxStack', 'maxStack', None, 1),
+    ('Tradeable', 'tradeable', 'bool', True),
+    ('Value', 'value', None, 0),
+    ('Weight', 'weight', None, 0.0),
+    ('Requirements', 'requirements', 'json', {}),
+    ('Stats', 'stats', 'json', {}),
+    ('Effects', 'effects', 'json', []),
+))
+
+ENEMIES_TABLE = TableSpec('DT_Enemies', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Category', 'category', None, ''),
+    ('Level', 'level', None, 1),
+    ('CombatLevel', 'combatLevel', None, 1),
+    ('Health', 'health', None, 100),
+    ('AttackStyle', 'attackStyle', None, 'melee'),
+    ('Aggressive', 'aggressive', 'bool', False),
+    ('RespawnTime', 'respawnTime', None, 60),
+    ('Zones', 'zones', 'list', []),
+    ('Stats', 'stats', 'json', {}),
+    ('Abilities', 'abilities', 'list', []),
+    ('LootTableRef', 'lootTableRef', None, ''),
+    ('BeastslayerLevel', 'beastslayerLevel', None, 0),
+    ('Immunities', 'immunities', 'list', []),
+    ('Weaknesses', 'weaknesses', 'list', []),
+))
+
+BOSSES_TABLE = TableSpec('DT_Bosses', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Category', 'category', None, ''),
+    ('Level', 'level', None, 1),
+    ('CombatLevel', 'combatLevel', None, 1),
+    ('Health', 'health', None, 1000),
+    ('Phases', 'phases', None, 1),
+    ('AttackStyles', 'attackStyles', 'list', []),
+    ('Zone', 'zone', None, ''),
+    ('Stats', 'stats', 'json', {}),
+    ('Abilities', 'abilities', 'list', []),
+    ('LootTableRef', 'lootTableRef', None, ''),
+    ('MinPlayers', 'minPlayers', None, 1),
+    ('Requirements', 'requirements', 'json', {}),
+))
+
+ABILITY_CATEGORIES = ('melee', 'ranged', 'magic', 'defense', 'prayer')
+
+ABILITIES_TABLE = TableSpec('DT_Abilities', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Category', Ctx('category'), None, None),
+    ('Type', 'type', None, 'basic'),
+    ('LevelRequired', 'levelRequired', None, 1),
+    ('Cooldown', 'cooldown', None, 0),
+    ('AdrenalineCost', 'adrenalineCost', None, 0),
+    ('AdrenalineGain', 'adrenalineGain', None, 0),
+    ('ManaCost', 'manaCost', None, 0),
+    ('PrayerDrain', 'prayerDrain', None, 0),
+    ('DamageType', 'damageType', None, 'physical'),
+    ('BaseDamage', 'baseDamage', None, 0),
+    ('DamageMultiplier', 'damageMultiplier', None, 1.0),
+    ('Duration', 'duration', None, 0),
+    ('Effects', 'effects', 'json', []),
+    ('Animation', 'animation', None, ''),
+    ('VFX', 'vfx', None, ''),
+    ('SFX', 'sfx', None, ''),
+), context=('category',))
+
+ZONES_TABLE = TableSpec('DT_Zones', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Region', Ctx('region_name'), None, None),
+    ('RegionId', Ctx('region_id'), None, None),
+    ('LevelRange', 'levelRange', 'json', {}),
+    ('Type', 'type', None, 'open_world'),
+    ('PvpEnabled', 'pvpEnabled', 'bool', False),
+    ('Connections', 'connections', 'list', []),
+    ('SpawnPoints', 'spawnPoints', 'json', []),
+    ('Bounds', 'bounds', 'json', {}),
+    ('Resources', 'resources', 'list', []),
+    ('Enemies', 'enemies', 'list', []),
+), context=('region_name', 'region_id'))
+
+QUESTS_TABLE = TableSpec('DT_Quests', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Difficulty', 'difficulty', None, 'novice'),
+    ('Length', 'length', None, 'short'),
+    ('StartNpc', 'startNpc', None, ''),
+    ('Requirements', 'requirements', 'json', {}),
+    ('Rewards', 'rewards', 'json', {}),
+    ('Objectives', 'objectives', 'json', []),
+    ('QuestPoints', 'questPoints', None, 1),
+    ('Members', 'members', 'bool', False),
+))
+
+LOOT_TABLES_TABLE = TableSpec('DT_LootTables', (
+    ('RowName', Ctx('table_id'), None, None),
+    ('AlwaysDrops', 'alwaysDrops', 'json', []),
+    ('MainDrops', 'mainDrops', 'json', []),
+    ('UncommonDrops', 'uncommonDrops', 'json', []),
+    ('RareDrops', 'rareDrops', 'json', []),
+    ('BeastslayerOnly', 'beastslayerOnly', 'bool', False),
+    ('BeastslayerLevel', 'beastslayerLevel', None, 0),
+), context=('table_id',))
+
+LOOT_POOLS_TABLE = TableSpec('DT_LootPools', (
+    ('RowName', Ctx('pool_id'), None, None),
+    ('Description', 'description', None, ''),
+    ('Items', 'items', 'json', []),
+), context=('pool_id',))
+
+RECIPES_TABLE = TableSpec('DT_Recipes', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Skill', 'skill', None, Ctx('skill_name')),
+    ('Category', Ctx('category'), None, None),
+    ('Level', 'level', None, 1),
+    ('XP', 'xp', None, 0),
+    ('Duration', 'duration', None, 1),
+    ('Inputs', 'inputs', 'json', []),
+    ('Outputs', 'outputs', 'json', []),
+    ('Tool', 'tool', None, ''),
+    ('Facility', 'facility', 'list', []),
+), context=('skill_name', 'category'))
+
+ACHIEVEMENTS_TABLE = TableSpec('DT_Achievements', (
+    ('RowName', 'id', None, ''),
+    ('Name', 'name', None, ''),
+    ('Description', 'description', None, ''),
+    ('Category', 'category', None, ''),
+    ('Tier', 'tier', None, 'easy'),
+    ('Points', 'points', None, 0),
+    ('Requirements', 'requirements', 'json', {}),
+    ('Rewards', 'rewards', 'json', {}),
+))
+
+
+# C++ struct definitions matching the exported Data Table columns
+UE5_STRUCT_DEFINITIONS = """#pragma once
 
 #include "CoreMinimal.h"
 #include "Engine/DataTable.h"
@@ -412,7 +373,7 @@ class UE5Exporter:
  */
 USTRUCT(BlueprintType)
 struct FItemDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -450,14 +411,14 @@ struct FItemDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     FString Effects;  // JSON string
-}};
+};
 
 /**
  * Enemy definition
  */
 USTRUCT(BlueprintType)
 struct FEnemyDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -501,14 +462,14 @@ struct FEnemyDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     int32 BeastslayerLevel = 0;
-}};
+};
 
 /**
  * Ability definition
  */
 USTRUCT(BlueprintType)
 struct FAbilityDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -561,14 +522,14 @@ struct FAbilityDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     FString SFX;
-}};
+};
 
 /**
  * Zone definition
  */
 USTRUCT(BlueprintType)
 struct FZoneDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -600,14 +561,14 @@ struct FZoneDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     FString Bounds;  // JSON object
-}};
+};
 
 /**
  * Quest definition
  */
 USTRUCT(BlueprintType)
 struct FQuestDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -639,14 +600,14 @@ struct FQuestDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     bool Members = false;
-}};
+};
 
 /**
  * Recipe definition
  */
 USTRUCT(BlueprintType)
 struct FRecipeDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -678,14 +639,14 @@ struct FRecipeDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     FString Facility;  // JSON array
-}};
+};
 
 /**
  * Achievement definition
  */
 USTRUCT(BlueprintType)
 struct FAchievementDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -708,14 +669,14 @@ struct FAchievementDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     FString Rewards;  // JSON object
-}};
+};
 
 /**
  * Loot table definition
  */
 USTRUCT(BlueprintType)
 struct FLootTableDefinition : public FTableRowBase
-{{
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
@@ -735,11 +696,348 @@ struct FLootTableDefinition : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite)
     int32 BeastslayerLevel = 0;
-}};
+};
 """
 
-        with open(structs_file, 'w', encoding='utf-8') as f:
-            f.write(header)
+# Written into the generated header so unchanged definitions are not rewritten
+UE5_STRUCTS_HASH = hashlib.sha256(UE5_STRUCT_DEFINITIONS.encode('utf-8')).hexdigest()
+
+
+def _up_to_date(sources: List[Path], outputs: List[Path]) -> bool:
+    """Return True if every output exists and is newer than every source.
+
+    A missing source is never up to date, so the export goes on to report it.
+    """
+    try:
+        oldest_output = min(path.stat().st_mtime for path in outputs)
+        return oldest_output >= max(path.stat().st_mtime for path in sources)
+    except FileNotFoundError:
+        return False
+
+
+class UE5Exporter:
+    """Export game data to UE5-compatible formats."""
+
+    def __init__(self, data_path: str, config: ExportConfig):
+        self.data_path = Path(data_path)
+        self.config = config
+        self.exported_files: List[str] = []
+        # Tables written during this run, so each step can stamp what it produced
+        self._written: Set[str] = set()
+
+    def ensure_output_dir(self):
+        """Create output directory if it doesn't exist."""
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def _table_path(self, name: str) -> Path:
+        suffix = TABLE_SUFFIXES[self.config.format]
+        if self.config.gzip and suffix == '.csv':
+            suffix += '.gz'
+        return self.config.output_dir / f"{name}{suffix}"
+
+    def _stamp_path(self, step: str) -> Path:
+        return self.config.output_dir / f".{step}.stamp"
+
+    def _unchanged(self, step: str, sources: List[Path]) -> bool:
+        """Check whether export ``step`` last ran after its sources changed.
+
+        The step's stamp lists the tables it wrote on that run; the stamp and
+        those tables must all be newer than the sources. Empty tables are
+        never written, so they are not required. The exporter script itself
+        counts as a source, so changing a column spec re-exports everything.
+        Always False with --force.
+        """
+        if self.config.force:
+            return False
+        stamp = self._stamp_path(step)
+        try:
+            names = stamp.read_text(encoding='utf-8').split()
+        except OSError:
+            return False
+        outputs = [stamp] + [self._table_path(name) for name in names]
+        return _up_to_date(sources + [Path(__file__)], outputs)
+
+    def _stamp(self, step: str, *specs: TableSpec):
+        """Record that ``step`` finished, listing which of ``specs`` it wrote."""
+        names = [spec.name for spec in specs if spec.name in self._written]
+        try:
+            self._stamp_path(step).write_text("".join(f"{name}\n" for name in names),
+                                              encoding='utf-8')
+        except OSError:
+            pass  # without a stamp the step just runs again next time
+
+    def load_json(self, file_path: Path) -> Optional[Dict]:
+        """Load a JSON file, or return None if it is missing or invalid."""
+        try:
+            return _load_file(file_path)
+        except FileNotFoundError:
+            print(f"{file_path} not found, skipping...")
+            return None
+        except Exception as e:
+            print(f"Error loading {file_path}: {e}")
+            return None
+
+    def export_items(self):
+        """Export items to UE5 Data Table format."""
+        items_file = self.data_path / "Items" / "items.json"
+        if self._unchanged('export_items', [items_file]):
+            print("Items up to date, skipping...")
+            return
+
+        data = self.load_json(items_file)
+        if not data:
+            return
+
+        count = self._export(ITEMS_TABLE, ITEMS_TABLE.rows(data.get('items', [])))
+        print(f"Exported {count} items")
+
+        self._stamp('export_items', ITEMS_TABLE)
+
+    def export_enemies(self):
+        """Export enemies to UE5 Data Table format."""
+        enemies_file = self.data_path / "Npcs" / "enemies.json"
+        if self._unchanged('export_enemies', [enemies_file]):
+            print("Enemies up to date, skipping...")
+            return
+
+        data = self.load_json(enemies_file)
+        if not data:
+            return
+
+        # Export regular enemies
+        count = self._export(ENEMIES_TABLE, ENEMIES_TABLE.rows(data.get('enemies', [])))
+        print(f"Exported {count} enemies")
+
+        # Export world bosses
+        bosses = chain(data.get('worldBosses', ()), data.get('dungeonBosses', ()))
+        count = self._export(BOSSES_TABLE, BOSSES_TABLE.rows(bosses))
+        if count:
+            print(f"Exported {count} bosses")
+
+        self._stamp('export_enemies', ENEMIES_TABLE, BOSSES_TABLE)
+
+    def export_abilities(self):
+        """Export abilities to UE5 Data Table format."""
+        abilities_file = self.data_path / "Combat" / "abilities.json"
+        if self._unchanged('export_abilities', [abilities_file]):
+            print("Abilities up to date, skipping...")
+            return
+
+        data = self.load_json(abilities_file)
+        if not data:
+            return
+
+        rows = chain.from_iterable(
+            ABILITIES_TABLE.rows(data.get(category, ()), category)
+            for category in ABILITY_CATEGORIES)
+        count = self._export(ABILITIES_TABLE, rows)
+        print(f"Exported {count} abilities")
+
+        self._stamp('export_abilities', ABILITIES_TABLE)
+
+    def export_zones(self):
+        """Export zones to UE5 Data Table format."""
+        zones_file = self.data_path / "World" / "zones.json"
+        if self._unchanged('export_zones', [zones_file]):
+            print("Zones up to date, skipping...")
+            return
+
+        data = self.load_json(zones_file)
+        if not data:
+            return
+
+        rows = chain.from_iterable(
+            ZONES_TABLE.rows(region.get('zones', ()), region.get('name', ''), region.get('id', ''))
+            for region in data.get('regions', ()))
+        count = self._export(ZONES_TABLE, rows)
+        print(f"Exported {count} zones")
+
+        self._stamp('export_zones', ZONES_TABLE)
+
+    def export_quests(self):
+        """Export quests to UE5 Data Table format."""
+        quests_file = self.data_path / "Quests" / "quests.json"
+        if self._unchanged('export_quests', [quests_file]):
+            print("Quests up to date, skipping...")
+            return
+
+        data = self.load_json(quests_file)
+        if not data:
+            return
+
+        count = self._export(QUESTS_TABLE, QUESTS_TABLE.rows(data.get('quests', [])))
+        print(f"Exported {count} quests")
+
+        self._stamp('export_quests', QUESTS_TABLE)
+
+    def export_loot_tables(self):
+        """Export loot tables to UE5 format."""
+        loot_file = self.data_path / "Npcs" / "loot_tables.json"
+        if self._unchanged('export_loot_tables', [loot_file]):
+            print("Loot tables up to date, skipping...")
+            return
+
+        data = self.load_json(loot_file)
+        if not data:
+            return
+
+        # Export enemy loot tables
+        build_row = LOOT_TABLES_TABLE.build_row
+        rows = (build_row(table, table_id)
+                for table_id, table in data.get('enemyLootTables', {}).items())
+        count = self._export(LOOT_TABLES_TABLE, rows)
+        print(f"Exported {count} loot tables")
+
+        # Export shared pools
+        build_row = LOOT_POOLS_TABLE.build_row
+        rows = (build_row(pool, pool_id)
+                for pool_id, pool in data.get('sharedPools', {}).items())
+        count = self._export(LOOT_POOLS_TABLE, rows)
+        if count:
+            print(f"Exported {count} loot pools")
+
+        self._stamp('export_loot_tables', LOOT_TABLES_TABLE, LOOT_POOLS_TABLE)
+
+    def export_recipes(self):
+        """Export all recipes to UE5 format."""
+        recipes_path = self.data_path / "Recipes"
+        try:
+            with os.scandir(recipes_path) as entries:
+                recipe_files = sorted(entry.name for entry in entries
+                                      if entry.name.endswith('.json') and entry.is_file())
+        except FileNotFoundError:
+            print("Recipes directory not found, skipping...")
+            return
+
+        # The directory's own mtime catches recipe files being removed
+        sources = [recipes_path] + [recipes_path / file_name for file_name in recipe_files]
+        if self._unchanged('export_recipes', sources):
+            print("Recipes up to date, skipping...")
+            return
+
+        with ThreadPoolExecutor(max_workers=RECIPE_LOAD_THREADS) as pool:
+            parsed = list(pool.map(self.load_json, sources[1:]))
+
+        # Rows are assembled on this thread, in file order
+        count = self._export(RECIPES_TABLE, _recipe_rows(recipe_files, parsed))
+        if count:
+            print(f"Exported {count} recipes")
+
+        self._stamp('export_recipes', RECIPES_TABLE)
+
+    def export_achievements(self):
+        """Export achievements to UE5 format."""
+        achievements_file = self.data_path / "Achievements" / "achievements.json"
+        if self._unchanged('export_achievements', [achievements_file]):
+            print("Achievements up to date, skipping...")
+            return
+
+        data = self.load_json(achievements_file)
+        if not data:
+            return
+
+        count = self._export(ACHIEVEMENTS_TABLE,
+                             ACHIEVEMENTS_TABLE.rows(data.get('achievements', [])))
+        print(f"Exported {count} achievements")
+
+        self._stamp('export_achievements', ACHIEVEMENTS_TABLE)
+
+    def _export(self, spec: TableSpec, rows: Iterable[Tuple]) -> int:
+        """Write a data table in the configured output format.
+
+        Returns the number of rows written; no file is created for an empty
+        table.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return 0
+        rows = chain((first,), rows)
+
+        if self.config.format in ('parquet', 'feather'):
+            count = self._write_arrow(spec, list(rows))
+        else:
+            count = self._write_csv(spec, rows)
+        self._written.add(spec.name)
+        return count
+
+    def _write_csv(self, spec: TableSpec, rows: Iterator[Tuple]) -> int:
+        """Write data to CSV file.
+
+        Each row is a tuple whose values are already in ``spec.fieldnames`` order.
+        Rows are consumed in batches, so the table is never held in memory.
+        """
+        output_file = self._table_path(spec.name)
+
+        count = 0
+        with self._open_csv(output_file) as f:
+            f.write(spec.header)
+            for batch in iter(lambda: list(islice(rows, WRITE_BATCH_ROWS)), []):
+                f.writelines(map(_csv_line, batch))
+                count += len(batch)
+
+        self.exported_files.append(str(output_file))
+        return count
+
+    def _open_csv(self, output_file: Path):
+        """Open a table file for text writing, gzip-compressed with --gzip."""
+        if not self.config.gzip:
+            return open(output_file, 'w', newline='', encoding='utf-8',
+                        buffering=WRITE_BUFFER_SIZE)
+
+        # mtime=0 keeps the archive bytes identical for identical tables
+        compressed = gzip.GzipFile(output_file, mode='wb',
+                                   compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+        return io.TextIOWrapper(compressed, encoding='utf-8', newline='')
+
+    def _write_arrow(self, spec: TableSpec, rows: List[Tuple]) -> int:
+        """Write data to a Parquet or Feather file (requires pyarrow)."""
+        import pyarrow as pa
+
+        columns = {}
+        for field_name, values in zip(spec.fieldnames, zip(*rows)):
+            try:
+                columns[field_name] = pa.array(values)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type column; store it as text, as the CSV would
+                columns[field_name] = pa.array(
+                    [None if v is None else str(v) for v in values], type=pa.string())
+        table = pa.table(columns)
+
+        output_file = self._table_path(spec.name)
+        if self.config.format == 'parquet':
+            import pyarrow.parquet as pq
+            pq.write_table(table, output_file, compression='zstd', compression_level=1)
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, output_file, compression='lz4')
+
+        self.exported_files.append(str(output_file))
+        return len(rows)
+
+    def generate_ue5_structs(self):
+        """Generate C++ struct definitions for UE5."""
+        structs_file = self.config.output_dir / "GameDataStructs.h"
+
+        hash_line = f"// Content hash: {UE5_STRUCTS_HASH}\n"
+        try:
+            with open(structs_file, 'r', encoding='utf-8') as f:
+                head = [f.readline() for _ in range(3)]
+        except FileNotFoundError:
+            head = []
+        if hash_line in head and not self.config.force:
+            # Rewriting an identical header would only retrigger UE5 rebuilds
+            print(f"UE5 struct definitions up to date: {structs_file}")
+            return
+
+        header = (
+            "// Auto-generated by export_to_ue5.py\n"
+            f"// Generated: {datetime.now().isoformat(timespec='seconds')}\n"
+            f"{hash_line}"
+            "// DO NOT EDIT MANUALLY\n"
+            "\n"
+        )
+        structs_file.write_bytes((header + UE5_STRUCT_DEFINITIONS).encode('utf-8'))
 
         self.exported_files.append(str(structs_file))
         print(f"Generated UE5 struct definitions: {structs_file}")
@@ -752,14 +1050,14 @@ struct FLootTableDefinition : public FTableRowBase
         print(f"Output directory: {self.config.output_dir}")
         print("-" * 50)
 
-        self.export_items()
-        self.export_enemies()
-        self.export_abilities()
-        self.export_zones()
-        self.export_quests()
-        self.export_loot_tables()
-        self.export_recipes()
-        self.export_achievements()
+        jobs = min(self.config.jobs, len(EXPORT_STEPS))
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                for files in pool.map(_run_export_step, repeat(self), EXPORT_STEPS):
+                    self.exported_files.extend(files)
+        else:
+            for step in EXPORT_STEPS:
+                getattr(self, step)()
 
         if self.config.generate_structs:
             self.generate_ue5_structs()
@@ -770,12 +1068,48 @@ struct FLootTableDefinition : public FTableRowBase
             print(f"  - {f}")
 
 
+def _recipe_rows(recipe_files: List[str], parsed: List[Optional[Dict]]) -> Iterator[Tuple]:
+    """Yield recipe rows from the parsed per-skill recipe files."""
+    build_rows = RECIPES_TABLE.rows
+    for file_name, data in zip(recipe_files, parsed):
+        if not data:
+            continue
+
+        skill_name = file_name[:-len('.json')]
+        for category, recipes in data.items():
+            if not isinstance(recipes, list):
+                continue
+
+            yield from build_rows(
+                (recipe for recipe in recipes if isinstance(recipe, dict)),
+                skill_name, category)
+
+
+def _run_export_step(exporter: UE5Exporter, step: str) -> List[str]:
+    """Run a single export step in a worker process.
+
+    The worker operates on its own copy of the exporter, so the written files
+    are returned for the parent to record.
+    """
+    exporter.exported_files = []
+    getattr(exporter, step)()
+    sys.stdout.flush()
+    return exporter.exported_files
+
+
 def main():
     parser = argparse.ArgumentParser(description='Export Realm of Eternity data to UE5 format')
     parser.add_argument('--data-path', default='Data', help='Path to Data directory')
     parser.add_argument('--output-dir', default='Export/UE5', help='Output directory for exports')
-    parser.add_argument('--format', choices=['csv', 'json'], default='csv', help='Export format')
+    parser.add_argument('--format', choices=['csv', 'json', 'parquet', 'feather'], default='csv',
+                        help='Export format (parquet/feather require pyarrow)')
     parser.add_argument('--no-structs', action='store_true', help='Skip C++ struct generation')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Compress CSV tables to .csv.gz')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-export every table even if its source data is unchanged')
+    parser.add_argument('--jobs', type=int, default=min(len(EXPORT_STEPS), os.cpu_count() or 1),
+                        help='Worker processes for the table exports (1 = serial)')
 
     args = parser.parse_args()
 
@@ -789,6 +1123,17 @@ def main():
         print(f"Error: Data directory not found at {data_path}")
         sys.exit(1)
 
+    if args.gzip and args.format not in ('csv', 'json'):
+        print(f"Error: --gzip only applies to CSV output, not --format {args.format}")
+        sys.exit(1)
+
+    if args.format in ('parquet', 'feather'):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print(f"Error: --format {args.format} requires pyarrow (pip install pyarrow)")
+            sys.exit(1)
+
     # Configure output
     output_dir = Path(args.output_dir)
     if not output_dir.is_absolute():
@@ -797,7 +1142,10 @@ def main():
     config = ExportConfig(
         output_dir=output_dir,
         format=args.format,
-        generate_structs=not args.no_structs
+        generate_structs=not args.no_structs,
+        jobs=args.jobs,
+        force=args.force,
+        gzip=args.gzip
     )
 
     exporter = UE5Exporter(str(data_path), config)
@@ -4,13 +4,25 @@ Realm of Eternity - Procedural Dungeon Generator
 Generates randomized dungeon layouts with rooms, corridors, and encounters.
 """
 
+import gzip
 import json
+import os
 import random
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Sequence, Set, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib encoder
+    orjson = None
+
 
 class RoomType(Enum):
     ENTRANCE = "entrance"
@@ -37,6 +49,41 @@ class TileType(Enum):
     STAIRS_DOWN = "stairs_down"
 
 
+# Room types assigned by _populate_rooms, in order of their cumulative chances
+_ROLLED_ROOM_TYPES = (RoomType.COMBAT, RoomType.PUZZLE, RoomType.TREASURE, RoomType.SAFE)
+
+# The grid stores one byte per tile: the TileType's position in the enum
+TILE_CODES = {tile: code for code, tile in enumerate(TileType)}
+FLOOR = TILE_CODES[TileType.FLOOR]
+WALL = TILE_CODES[TileType.WALL]
+DOOR = TILE_CODES[TileType.DOOR]
+LOCKED_DOOR = TILE_CODES[TileType.LOCKED_DOOR]
+TRAP = TILE_CODES[TileType.TRAP]
+
+_FLOOR_TILE = bytes([FLOOR])
+
+# Exported names, looked up once instead of through the enum's .value descriptor
+_TILE_VALUES = tuple(tile.value for tile in TileType)  # indexed by tile code
+_ROOM_TYPE_VALUES = {room_type: room_type.value for room_type in RoomType}
+
+# ASCII preview symbol per tile; tiles not listed are shown as '?'
+PREVIEW_SYMBOLS = {
+    TileType.FLOOR: ".",
+    TileType.WALL: "#",
+    TileType.DOOR: "+",
+    TileType.LOCKED_DOOR: "+",
+    TileType.TRAP: "^",
+    TileType.STAIRS_UP: "<",
+    TileType.STAIRS_DOWN: ">",
+}
+
+# bytes.translate table from tile code to preview symbol
+_PREVIEW_TABLE = bytes(ord(PREVIEW_SYMBOLS.get(tile, "?")) for tile in TileType).ljust(256, b"?")
+
+# bytes.translate table mapping floor tiles to 1 and everything else to 0
+_FLOOR_MASK = bytes(1 if code == FLOOR else 0 for code in range(256))
+
+
 @dataclass
 class Room:
     id: int
@@ -45,13 +92,120 @@ class Room:
     y: int
     width: int
     height: int
-    connections: List[int] = field(default_factory=list)
+    connections: Set[int] = field(default_factory=set)
     encounters: List[Dict] = field(default_factory=list)
     loot: List[Dict] = field(default_factory=list)
     puzzle: Optional[Dict] = None
     skill_requirement: Optional[Dict] = None
 
 
+class _RoomLayout:
+    """Room rectangles and centers stored column-wise, indexed like rooms.
+
+    Each room is kept as its bounds grown by ``padding`` on every side, so an
+    overlap test is four integer comparisons per room with no attribute
+    lookups. Centers are recorded once when the room is added.
+
+    Rooms are also bucketed into a coarse grid of ``cell_size`` square cells
+    covering their padded bounds, so an overlap query only tests the rooms
+    registered in the cells the candidate rectangle touches.
+    """
+
+    def __init__(self, padding: int, cell_size: int):
+        self.padding = padding
+        self.cell_size = cell_size
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self.left = array('i')
+        self.top = array('i')
+        self.right = array('i')
+        self.bottom = array('i')
+        self.cx = array('i')
+        self.cy = array('i')
+
+    def _cells(self, left: int, top: int, right: int, bottom: int):
+        """Grid cells covering the half-open rectangle [left, right) x [top, bottom)."""
+        size = self.cell_size
+        cols = range(left // size, (right - 1) // size + 1)
+        return [(col, row) for row in range(top // size, (bottom - 1) // size + 1) for col in cols]
+
+    def add(self, x: int, y: int, width: int, height: int):
+        pad = self.padding
+        index = len(self.left)
+        self.left.append(x - pad)
+        self.top.append(y - pad)
+        self.right.append(x + width + pad)
+        self.bottom.append(y + height + pad)
+        for cell in self._cells(x - pad, y - pad, x + width + pad, y + height + pad):
+            self._buckets.setdefault(cell, []).append(index)
+        self.cx.append(x + width // 2)
+        self.cy.append(y + height // 2)
+
+    def distance2(self, i: int, j: int) -> int:
+        """Squared distance between the centers of rooms i and j."""
+        dx = self.cx[i] - self.cx[j]
+        dy = self.cy[i] - self.cy[j]
+        return dx * dx + dy * dy
+
+    def overlaps(self, x: int, y: int, width: int, height: int) -> bool:
+        x2 = x + width
+        y2 = y + height
+        left, top, right, bottom = self.left, self.top, self.right, self.bottom
+        get_bucket = self._buckets.get
+        size = self.cell_size
+        cols = range(x // size, (x2 - 1) // size + 1)
+        for row in range(y // size, (y2 - 1) // size + 1):
+            for col in cols:
+                for i in get_bucket((col, row), ()):
+                    if x < right[i] and x2 > left[i] and y < bottom[i] and y2 > top[i]:
+                        return True
+        return False
+
+
+def _prim_mst(cx: Sequence[int], cy: Sequence[int]) -> List[Tuple[int, int]]:
+    """Minimum spanning tree over points, as (parent, child) edges in join order.
+
+    Dense Prim's algorithm on squared distances: best[u] is the distance from
+    u to the nearest point already in the tree and parent[u] that point. Only
+    the point that just joined is compared against, so the whole tree costs
+    O(N^2). Equal distances resolve to the lowest (parent, child) pair.
+    """
+    n = len(cx)
+    inf = float('inf')
+    best = [inf] * n
+    parent = [0] * n
+    in_tree = [False] * n
+    in_tree[0] = True
+    last = 0
+    edges = []
+
+    for _ in range(n - 1):
+        lx = cx[last]
+        ly = cy[last]
+        nearest = -1
+        nearest_dist = inf
+        nearest_parent = n
+        for u in range(n):
+            if in_tree[u]:
+                continue
+            dx = cx[u] - lx
+            dy = cy[u] - ly
+            dist = dx * dx + dy * dy
+            b = best[u]
+            if dist < b or (dist == b and last < parent[u]):
+                best[u] = b = dist
+                parent[u] = last
+            if b < nearest_dist or (b == nearest_dist and parent[u] < nearest_parent):
+                nearest = u
+                nearest_dist = b
+                nearest_parent = parent[u]
+
+        edges.append((nearest_parent, nearest))
+        in_tree[nearest] = True
+        last = nearest
+
+    return edges
+
+
 @dataclass
 class DungeonConfig:
     name: str
@@ -79,17 +233,32 @@ class DungeonGenerator:
 
     def __init__(self, config: DungeonConfig, seed: Optional[int] = None):
         self.config = config
-        self.seed = seed or random.randint(0, 2**32)
-        random.seed(self.seed)
+        self.seed = seed if seed is not None else random.randint(0, 2**32)
+        # Private generator, so other users of the random module (or other
+        # generators) cannot perturb this dungeon's sequence
+        self._rng = random.Random(self.seed)
         self.rooms: List[Room] = []
-        self.grid: List[List[TileType]] = []
+        # Room ids (which are also indices into self.rooms) grouped by type;
+        # change types through set_room_type() to keep this current
+        self._rooms_by_type: Dict[RoomType, List[int]] = defaultdict(list)
+        # One cell per largest padded room keeps each room in at most 4 cells
+        self._layout = _RoomLayout(padding=2, cell_size=config.max_room_size + 4)
+        self.grid = bytearray()  # row-major, config.width tiles per row
         self.next_room_id = 0
-
-    def generate(self) -> Dict:
-        """Generate a complete dungeon."""
+        # Table entries resolved once, not per spawned monster or item
+        self._monsters = [(m.get("id", "generic_monster"), m.get("level", 1))
+                          for m in config.monster_table]
+        self._loot_items = [(item.get("id", "gold_coins"), item.get("max_quantity", 1))
+                            for item in config.loot_table]
+
+    def generate(self, legacy_grid: bool = False) -> Dict:
+        """Generate a complete dungeon.
+
+        The grid is exported as rows of tile codes described by "tile_legend";
+        ``legacy_grid`` exports rows of tile names instead.
+        """
         # Initialize grid
-        self.grid = [[TileType.WALL for _ in range(self.config.width)]
-                     for _ in range(self.config.height)]
+        self.grid = bytearray([WALL]) * (self.config.width * self.config.height)
 
         # Generate rooms using BSP
         self._generate_rooms_bsp()
@@ -100,6 +269,9 @@ class DungeonGenerator:
         # Place entrance and boss room
         self._place_special_rooms()
 
+        # Put doors where corridors enter rooms
+        self._place_doors()
+
         # Add encounters and loot
         self._populate_rooms()
 
@@ -109,118 +281,159 @@ class DungeonGenerator:
         # Add secret rooms
         self._add_secret_rooms()
 
-        return self._export()
+        return self._export(legacy_grid)
 
     def _generate_rooms_bsp(self):
-        """Generate rooms using Binary Space Partitioning."""
-        num_rooms = random.randint(self.config.min_rooms, self.config.max_rooms)
-
-        for _ in range(num_rooms * 3):  # Try multiple times
-            if len(self.rooms) >= num_rooms:
-                break
-
-            # Random room dimensions
-            width = random.randint(self.config.min_room_size, self.config.max_room_size)
-            height = random.randint(self.config.min_room_size, self.config.max_room_size)
-
-            # Random position (with padding)
-            x = random.randint(2, self.config.width - width - 2)
-            y = random.randint(2, self.config.height - height - 2)
-
-            # Check for overlap
-            if not self._check_room_overlap(x, y, width, height):
-                room = Room(
-                    id=self.next_room_id,
-                    room_type=RoomType.CORRIDOR,  # Will be assigned later
-                    x=x, y=y, width=width, height=height
-                )
-                self.next_room_id += 1
-                self.rooms.append(room)
-                self._carve_room(room)
+        """Generate rooms using Binary Space Partitioning.
+
+        The map inside a one-tile border is split recursively into disjoint
+        leaves with one room per leaf, so rooms cannot overlap and no
+        placement attempts are rejected.
+        """
+        config = self.config
+        num_rooms = self._rng.randint(config.min_rooms, config.max_rooms)
+        self._bsp_split(1, 1, config.width - 2, config.height - 2, num_rooms)
+
+    def _bsp_split(self, x: int, y: int, width: int, height: int, count: int):
+        """Place up to ``count`` rooms in the given region.
+
+        Each room keeps a one-tile margin inside its leaf, so rooms in
+        neighbouring leaves are at least two tiles apart, the same spacing
+        _check_room_overlap enforces.
+        """
+        min_leaf = self.config.min_room_size + 2
+        split_x = width >= 2 * min_leaf
+        split_y = height >= 2 * min_leaf
+        if count < 2 or not (split_x or split_y):
+            self._place_leaf_room(x, y, width, height)
+            return
+
+        # Cut across the longer side, between 30% and 70% of it where possible
+        if split_x and split_y:
+            split_x = width >= height
+        size = width if split_x else height
+        lo = max(min_leaf, int(size * 0.3))
+        hi = min(size - min_leaf, int(size * 0.7))
+        if lo > hi:
+            lo, hi = min_leaf, size - min_leaf
+        cut = self._rng.randint(lo, hi)
+
+        # Share the rooms between the halves by area
+        first = min(count - 1, max(1, round(count * cut / size)))
+        if split_x:
+            self._bsp_split(x, y, cut, height, first)
+            self._bsp_split(x + cut, y, width - cut, height, count - first)
+        else:
+            self._bsp_split(x, y, width, cut, first)
+            self._bsp_split(x, y + cut, width, height - cut, count - first)
+
+    def _place_leaf_room(self, x: int, y: int, width: int, height: int):
+        """Carve a randomly sized and positioned room inside a BSP leaf."""
+        config = self.config
+        randint = self._rng.randint
+        max_width = min(config.max_room_size, width - 2)
+        max_height = min(config.max_room_size, height - 2)
+        if max_width < config.min_room_size or max_height < config.min_room_size:
+            return
+
+        room_width = randint(config.min_room_size, max_width)
+        room_height = randint(config.min_room_size, max_height)
+        room = Room(
+            id=self.next_room_id,
+            room_type=RoomType.CORRIDOR,  # Will be assigned later
+            x=randint(x + 1, x + width - 1 - room_width),
+            y=randint(y + 1, y + height - 1 - room_height),
+            width=room_width, height=room_height
+        )
+        self._add_room(room)
+
+    def _add_room(self, room: Room):
+        """Register a new room and carve it into the grid."""
+        self.next_room_id += 1
+        self.rooms.append(room)
+        self._rooms_by_type[room.room_type].append(room.id)
+        self._carve_room(room)
+
+    def set_room_type(self, room: Room, room_type: RoomType):
+        """Change a room's type, keeping the by-type index in step."""
+        if room.room_type is room_type:
+            return
+        self._rooms_by_type[room.room_type].remove(room.id)
+        self._rooms_by_type[room_type].append(room.id)
+        room.room_type = room_type
+
+    def rooms_of_type(self, room_type: RoomType) -> List[Room]:
+        """Rooms currently of the given type, in the order they took it."""
+        rooms = self.rooms
+        return [rooms[i] for i in self._rooms_by_type.get(room_type, ())]
 
     def _check_room_overlap(self, x: int, y: int, width: int, height: int) -> bool:
         """Check if a room would overlap with existing rooms."""
-        padding = 2
-        for room in self.rooms:
-            if (x < room.x + room.width + padding and
-                x + width + padding > room.x and
-                y < room.y + room.height + padding and
-                y + height + padding > room.y):
-                return True
-        return False
+        return self._layout.overlaps(x, y, width, height)
 
     def _carve_room(self, room: Room):
-        """Carve out a room in the grid."""
+        """Carve out a room in the grid and record its bounds."""
+        self._layout.add(room.x, room.y, room.width, room.height)
+        width = self.config.width
+        floor_row = _FLOOR_TILE * room.width
         for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                self.grid[y][x] = TileType.FLOOR
+            start = y * width + room.x
+            self.grid[start:start + room.width] = floor_row
 
     def _connect_rooms(self):
         """Connect rooms with corridors using minimum spanning tree."""
-        if len(self.rooms) < 2:
+        rooms = self.rooms
+        if len(rooms) < 2:
             return
 
-        connected: Set[int] = {0}
-        unconnected: Set[int] = set(range(1, len(self.rooms)))
-
-        while unconnected:
-            best_dist = float('inf')
-            best_pair = (0, 1)
-
-            for c in connected:
-                for u in unconnected:
-                    dist = self._room_distance(self.rooms[c], self.rooms[u])
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_pair = (c, u)
-
-            self._carve_corridor(self.rooms[best_pair[0]], self.rooms[best_pair[1]])
-            self.rooms[best_pair[0]].connections.append(best_pair[1])
-            self.rooms[best_pair[1]].connections.append(best_pair[0])
-
-            connected.add(best_pair[1])
-            unconnected.remove(best_pair[1])
+        for c, u in _prim_mst(self._layout.cx, self._layout.cy):
+            self._carve_corridor(rooms[c], rooms[u])
+            rooms[c].connections.add(u)
+            rooms[u].connections.add(c)
 
         # Add some extra connections for loops
-        extra_connections = random.randint(1, len(self.rooms) // 4)
+        extra_connections = self._rng.randint(1, len(self.rooms) // 4)
         for _ in range(extra_connections):
-            r1 = random.choice(self.rooms)
-            r2 = random.choice(self.rooms)
+            r1 = self._rng.choice(self.rooms)
+            r2 = self._rng.choice(self.rooms)
             if r1.id != r2.id and r2.id not in r1.connections:
                 self._carve_corridor(r1, r2)
-                r1.connections.append(r2.id)
-                r2.connections.append(r1.id)
-
-    def _room_distance(self, r1: Room, r2: Room) -> float:
-        """Calculate distance between room centers."""
-        c1 = (r1.x + r1.width // 2, r1.y + r1.height // 2)
-        c2 = (r2.x + r2.width // 2, r2.y + r2.height // 2)
-        return ((c1[0] - c2[0]) ** 2 + (c1[1] - c2[1]) ** 2) ** 0.5
+                r1.connections.add(r2.id)
+                r2.connections.add(r1.id)
 
     def _carve_corridor(self, r1: Room, r2: Room):
         """Carve a corridor between two rooms."""
-        c1 = (r1.x + r1.width // 2, r1.y + r1.height // 2)
-        c2 = (r2.x + r2.width // 2, r2.y + r2.height // 2)
+        cx, cy = self._layout.cx, self._layout.cy
+        x1, y1 = cx[r1.id], cy[r1.id]
+        x2, y2 = cx[r2.id], cy[r2.id]
 
         # L-shaped corridor
-        if random.random() < 0.5:
-            self._carve_h_corridor(c1[0], c2[0], c1[1])
-            self._carve_v_corridor(c1[1], c2[1], c2[0])
+        if self._rng.random() < 0.5:
+            self._carve_h_corridor(x1, x2, y1)
+            self._carve_v_corridor(y1, y2, x2)
         else:
-            self._carve_v_corridor(c1[1], c2[1], c1[0])
-            self._carve_h_corridor(c1[0], c2[0], c2[1])
+            self._carve_v_corridor(y1, y2, x1)
+            self._carve_h_corridor(x1, x2, y2)
 
     def _carve_h_corridor(self, x1: int, x2: int, y: int):
-        """Carve a horizontal corridor."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            if 0 <= x < self.config.width and 0 <= y < self.config.height:
-                self.grid[y][x] = TileType.FLOOR
+        """Carve a horizontal corridor, clipped to the map."""
+        width = self.config.width
+        if not 0 <= y < self.config.height:
+            return
+        lo, hi = max(min(x1, x2), 0), min(max(x1, x2), width - 1)
+        if lo <= hi:
+            start = y * width
+            self.grid[start + lo:start + hi + 1] = _FLOOR_TILE * (hi - lo + 1)
 
     def _carve_v_corridor(self, y1: int, y2: int, x: int):
-        """Carve a vertical corridor."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            if 0 <= x < self.config.width and 0 <= y < self.config.height:
-                self.grid[y][x] = TileType.FLOOR
+        """Carve a vertical corridor, clipped to the map."""
+        width = self.config.width
+        if not 0 <= x < width:
+            return
+        lo, hi = max(min(y1, y2), 0), min(max(y1, y2), self.config.height - 1)
+        if lo <= hi:
+            # Every width-th byte from the top cell is one grid column
+            self.grid[lo * width + x:hi * width + x + 1:width] = _FLOOR_TILE * (hi - lo + 1)
 
     def _place_special_rooms(self):
         """Designate entrance and boss rooms."""
@@ -231,63 +444,93 @@ class DungeonGenerator:
         entrance = min(self.rooms, key=lambda r: min(r.x, r.y,
                        self.config.width - r.x - r.width,
                        self.config.height - r.y - r.height))
-        entrance.room_type = RoomType.ENTRANCE
-
-        # Boss room is furthest from entrance
-        boss = max(self.rooms, key=lambda r: self._room_distance(entrance, r))
-        boss.room_type = RoomType.BOSS
+        self.set_room_type(entrance, RoomType.ENTRANCE)
+
+        # Boss room is furthest from entrance (squared distance ranks the same)
+        distance2 = self._layout.distance2
+        boss = max(self.rooms, key=lambda r: distance2(entrance.id, r.id))
+        self.set_room_type(boss, RoomType.BOSS)
+
+    def _place_doors(self):
+        """Turn corridor openings in each room's surrounding wall ring into doors.
+
+        A corridor crosses the ring as a floor tile whose two neighbours along
+        the ring are not floor; corridors running alongside the wall are left
+        open. Boss rooms get locked doors.
+        """
+        grid = self.grid
+        width = self.config.width
+        for room in self.rooms:
+            door = LOCKED_DOOR if room.room_type is RoomType.BOSS else DOOR
+            top_left = (room.y - 1) * width + room.x - 1
+            # (first grid index, stride, length) of each ring side, corners included
+            sides = (
+                (top_left, 1, room.width + 2),
+                (top_left + (room.height + 1) * width, 1, room.width + 2),
+                (top_left, width, room.height + 2),
+                (top_left + room.width + 1, width, room.height + 2),
+            )
+            for start, step, length in sides:
+                line = grid[start:start + (length - 1) * step + 1:step]
+                for i in range(1, length - 1):
+                    if line[i] == FLOOR and line[i - 1] != FLOOR and line[i + 1] != FLOOR:
+                        grid[start + i * step] = door
 
     def _populate_rooms(self):
         """Add encounters and loot to rooms."""
+        config = self.config
+        roll = self._rng.random
+        # Cumulative chances; bisecting a roll gives its index in _ROLLED_ROOM_TYPES
+        thresholds = (
+            config.combat_room_chance,
+            config.combat_room_chance + config.puzzle_room_chance,
+            config.combat_room_chance + config.puzzle_room_chance + config.treasure_room_chance,
+        )
+
         for room in self.rooms:
             if room.room_type in (RoomType.ENTRANCE, RoomType.BOSS):
                 continue
 
-            roll = random.random()
-            if roll < self.config.combat_room_chance:
-                room.room_type = RoomType.COMBAT
+            room_type = _ROLLED_ROOM_TYPES[bisect_right(thresholds, roll())]
+            self.set_room_type(room, room_type)
+            if room_type is RoomType.COMBAT:
                 room.encounters = self._generate_encounters(room)
-            elif roll < self.config.combat_room_chance + self.config.puzzle_room_chance:
-                room.room_type = RoomType.PUZZLE
+            elif room_type is RoomType.PUZZLE:
                 room.puzzle = self._generate_puzzle()
-            elif roll < (self.config.combat_room_chance +
-                        self.config.puzzle_room_chance +
-                        self.config.treasure_room_chance):
-                room.room_type = RoomType.TREASURE
+            elif room_type is RoomType.TREASURE:
                 room.loot = self._generate_loot(room, bonus=True)
-            else:
-                room.room_type = RoomType.SAFE
 
             # All non-entrance rooms can have loot
-            if room.room_type != RoomType.TREASURE and random.random() < 0.3:
+            if room_type is not RoomType.TREASURE and roll() < 0.3:
                 room.loot = self._generate_loot(room)
 
         # Populate boss room
-        boss_rooms = [r for r in self.rooms if r.room_type == RoomType.BOSS]
-        for boss_room in boss_rooms:
+        for boss_room in self.rooms_of_type(RoomType.BOSS):
             boss_room.encounters = self._generate_boss_encounter()
             boss_room.loot = self._generate_loot(boss_room, boss=True)
 
     def _generate_encounters(self, room: Room) -> List[Dict]:
         """Generate monster encounters for a room."""
-        if not self.config.monster_table:
+        monsters = self._monsters
+        if not monsters:
             return []
 
-        num_monsters = random.randint(1, max(1, (room.width * room.height) // 20))
-        encounters = []
+        randint, choice = self._rng.randint, self._rng.choice
+        num_monsters = randint(1, max(1, (room.width * room.height) // 20))
+        x_min, x_max = room.x + 1, room.x + room.width - 2
+        y_min, y_max = room.y + 1, room.y + room.height - 2
 
-        for _ in range(num_monsters):
-            monster = random.choice(self.config.monster_table)
-            encounters.append({
-                "monster_id": monster.get("id", "generic_monster"),
-                "level": monster.get("level", 1),
+        return [
+            {
+                "monster_id": monster_id,
+                "level": level,
                 "position": {
-                    "x": random.randint(room.x + 1, room.x + room.width - 2),
-                    "y": random.randint(room.y + 1, room.y + room.height - 2)
+                    "x": randint(x_min, x_max),
+                    "y": randint(y_min, y_max)
                 }
-            })
-
-        return encounters
+            }
+            for monster_id, level in (choice(monsters) for _ in range(num_monsters))
+        ]
 
     def _generate_boss_encounter(self) -> List[Dict]:
         """Generate boss encounter."""
@@ -302,63 +545,58 @@ class DungeonGenerator:
 
     def _generate_loot(self, room: Room, bonus: bool = False, boss: bool = False) -> List[Dict]:
         """Generate loot for a room."""
-        if not self.config.loot_table:
+        loot_items = self._loot_items
+        if not loot_items:
             return []
 
-        num_items = random.randint(1, 3)
+        randint, choice = self._rng.randint, self._rng.choice
+        num_items = randint(1, 3)
         if bonus:
             num_items += 2
         if boss:
             num_items += 3
+        multiplier = 2 if boss else 1
 
-        loot = []
-        for _ in range(num_items):
-            item = random.choice(self.config.loot_table)
-            quantity = random.randint(1, item.get("max_quantity", 1))
-            if boss:
-                quantity *= 2
-            loot.append({
-                "item_id": item.get("id", "gold_coins"),
-                "quantity": quantity
-            })
-
-        return loot
+        return [
+            {
+                "item_id": item_id,
+                "quantity": randint(1, max_quantity) * multiplier
+            }
+            for item_id, max_quantity in (choice(loot_items) for _ in range(num_items))
+        ]
 
     def _generate_puzzle(self) -> Dict:
         """Generate a puzzle configuration."""
         puzzle_types = [
-            {"type": "lever_sequence", "levers": random.randint(3, 6)},
-            {"type": "pressure_plates", "plates": random.randint(4, 9)},
-            {"type": "symbol_matching", "symbols": random.randint(3, 5)},
-            {"type": "torch_lighting", "torches": random.randint(4, 8)},
-            {"type": "block_pushing", "blocks": random.randint(2, 4)}
+            {"type": "lever_sequence", "levers": self._rng.randint(3, 6)},
+            {"type": "pressure_plates", "plates": self._rng.randint(4, 9)},
+            {"type": "symbol_matching", "symbols": self._rng.randint(3, 5)},
+            {"type": "torch_lighting", "torches": self._rng.randint(4, 8)},
+            {"type": "block_pushing", "blocks": self._rng.randint(2, 4)}
         ]
-        return random.choice(puzzle_types)
+        return self._rng.choice(puzzle_types)
 
     def _add_traps(self):
         """Add traps to the dungeon."""
-        floor_tiles = []
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                if self.grid[y][x] == TileType.FLOOR:
-                    floor_tiles.append((x, y))
+        grid = self.grid
+        floor_tiles = list(compress(range(len(grid)), grid.translate(_FLOOR_MASK)))
 
         num_traps = int(len(floor_tiles) * self.config.trap_density)
-        trap_tiles = random.sample(floor_tiles, min(num_traps, len(floor_tiles)))
+        trap_tiles = self._rng.sample(floor_tiles, min(num_traps, len(floor_tiles)))
 
-        for x, y in trap_tiles:
-            self.grid[y][x] = TileType.TRAP
+        for i in trap_tiles:
+            grid[i] = TRAP
 
     def _add_secret_rooms(self):
         """Add secret rooms to the dungeon."""
-        if random.random() > self.config.secret_room_chance:
+        if self._rng.random() > self.config.secret_room_chance:
             return
 
         # Try to add a secret room adjacent to an existing room
         for _ in range(10):
-            base_room = random.choice(self.rooms)
-            width = random.randint(3, 6)
-            height = random.randint(3, 6)
+            base_room = self._rng.choice(self.rooms)
+            width = self._rng.randint(3, 6)
+            height = self._rng.randint(3, 6)
 
             # Try each side
             positions = [
@@ -379,15 +617,21 @@ class DungeonGenerator:
                         room_type=RoomType.SECRET,
                         x=x, y=y, width=width, height=height
                     )
-                    self.next_room_id += 1
-                    self.rooms.append(secret)
-                    self._carve_room(secret)
+                    self._add_room(secret)
                     secret.loot = self._generate_loot(secret, bonus=True)
                     return
 
-    def _export(self) -> Dict:
+    def _export(self, legacy_grid: bool = False) -> Dict:
         """Export dungeon to dictionary format."""
-        return {
+        width = self.config.width
+        rows = [self.grid[start:start + width] for start in range(0, len(self.grid), width)]
+        if legacy_grid:
+            tile_value = _TILE_VALUES.__getitem__
+            grid = [list(map(tile_value, row)) for row in rows]
+        else:
+            grid = [list(row) for row in rows]
+
+        dungeon = {
             "metadata": {
                 "name": self.config.name,
                 "theme": self.config.theme,
@@ -399,14 +643,14 @@ class DungeonGenerator:
             "rooms": [
                 {
                     "id": room.id,
-                    "type": room.room_type.value,
+                    "type": _ROOM_TYPE_VALUES[room.room_type],
                     "bounds": {
                         "x": room.x,
                         "y": room.y,
                         "width": room.width,
                         "height": room.height
                     },
-                    "connections": room.connections,
+                    "connections": sorted(room.connections),
                     "encounters": room.encounters,
                     "loot": room.loot,
                     "puzzle": room.puzzle,
@@ -414,44 +658,100 @@ class DungeonGenerator:
                 }
                 for room in self.rooms
             ],
-            "grid": [
-                [tile.value for tile in row]
-                for row in self.grid
-            ],
+            "grid": grid,
             "required_skills": self.config.required_skills
         }
+        if not legacy_grid:
+            dungeon["tile_legend"] = {str(code): value for code, value in enumerate(_TILE_VALUES)}
+        return dungeon
+
+
+def _encode_dungeon(dungeon: Dict, pretty: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(dungeon, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(dungeon, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(dungeon, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_dungeon(dungeon: Dict, output_path: Path, pretty: bool = False):
+    """Write compact JSON (indented with ``pretty``), gzipped for a .gz path."""
+    data = _encode_dungeon(dungeon, pretty)
+    if output_path.suffix == '.gz':
+        # Level 1 already shrinks the grid-heavy JSON several times over
+        with gzip.GzipFile(output_path, 'wb', compresslevel=1, mtime=0) as f:
+            f.write(data)
+    else:
+        output_path.write_bytes(data)
 
 
-def generate_dungeon(config_path: Path, output_path: Path, seed: Optional[int] = None):
+def generate_dungeon(config_path: Path, output_path: Path, seed: Optional[int] = None,
+                     legacy_grid: bool = False, pretty: bool = False):
     """Generate a dungeon from a config file."""
     with open(config_path) as f:
         config_data = json.load(f)
 
     config = DungeonConfig(**config_data)
     generator = DungeonGenerator(config, seed)
-    dungeon = generator.generate()
+    dungeon = generator.generate(legacy_grid)
 
-    with open(output_path, 'w') as f:
-        json.dump(dungeon, f, indent=2)
+    _write_dungeon(dungeon, output_path, pretty)
 
     return dungeon
 
 
+def _generate_one(config: DungeonConfig, seed: Optional[int], output_path: Path,
+                  legacy_grid: bool = False, pretty: bool = False) -> Dict:
+    """Generate and write one dungeon; returns its metadata and room count."""
+    dungeon = DungeonGenerator(config, seed).generate(legacy_grid)
+    _write_dungeon(dungeon, output_path, pretty)
+    return dict(dungeon["metadata"], rooms=len(dungeon["rooms"]))
+
+
+def generate_dungeons(configs: List[DungeonConfig], seeds: List[Optional[int]],
+                      output_paths: List[Path], workers: Optional[int] = None,
+                      legacy_grid: bool = False, pretty: bool = False) -> List[Dict]:
+    """Generate many dungeons in parallel worker processes.
+
+    Each dungeon is generated and written by a worker; only its metadata is
+    sent back. Results are in input order and each dungeon depends only on
+    its own config and seed, so the output matches a serial run.
+    """
+    options = (repeat(legacy_grid), repeat(pretty))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(configs) == 1:
+        return list(map(_generate_one, configs, seeds, output_paths, *options))
+
+    chunksize = max(1, len(configs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_generate_one, configs, seeds, output_paths, *options,
+                             chunksize=chunksize))
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Generate procedural dungeons")
     parser.add_argument("--config", type=Path, help="Dungeon configuration file")
     parser.add_argument("--output", type=Path, default=Path("dungeon.json"),
-                       help="Output file path")
+                       help="Output file path (gzip-compressed if it ends in .gz)")
     parser.add_argument("--seed", type=int, help="Random seed for reproducibility")
     parser.add_argument("--preview", action="store_true", help="Show ASCII preview")
+    parser.add_argument("--count", type=int, default=1,
+                       help="Number of dungeons to generate (written as NAME_0.json, ...)")
+    parser.add_argument("--workers", type=int,
+                       help="Worker processes for --count (default: one per CPU)")
+    parser.add_argument("--pretty", action="store_true",
+                       help="Indent the output JSON for reading")
+    parser.add_argument("--legacy-grid", action="store_true",
+                       help="Export the grid as tile names instead of tile codes")
 
     args = parser.parse_args()
 
     # Default config if none provided
     if args.config and args.config.exists():
-        dungeon = generate_dungeon(args.config, args.output, args.seed)
+        with open(args.config) as f:
+            config = DungeonConfig(**json.load(f))
     else:
         config = DungeonConfig(
             name="Generated Dungeon",
@@ -473,11 +773,24 @@ def main():
                 "mechanics": ["aoe_attack", "summon_adds"]
             }
         )
-        generator = DungeonGenerator(config, args.seed)
-        dungeon = generator.generate()
 
-        with open(args.output, 'w') as f:
-            json.dump(dungeon, f, indent=2)
+    if args.count > 1:
+        # Consecutive seeds keep every dungeon in the batch reproducible
+        base_seed = args.seed if args.seed is not None else random.randint(0, 2**32)
+        seeds = [base_seed + i for i in range(args.count)]
+        # Number before the extension, keeping a trailing .gz: dungeon_0.json.gz
+        gz = '.gz' if args.output.suffix == '.gz' else ''
+        base = args.output.with_suffix('') if gz else args.output
+        outputs = [base.with_name(f"{base.stem}_{i}{base.suffix}{gz}") for i in range(args.count)]
+        results = generate_dungeons([config] * args.count, seeds, outputs, args.workers,
+                                    args.legacy_grid, args.pretty)
+        for output, metadata in zip(outputs, results):
+            print(f"{output}: {metadata['rooms']} rooms, seed {metadata['seed']}")
+        return
+
+    generator = DungeonGenerator(config, args.seed)
+    dungeon = generator.generate(args.legacy_grid)
+    _write_dungeon(dungeon, args.output, args.pretty)
 
     print(f"Generated dungeon with {len(dungeon['rooms'])} rooms")
     print(f"Seed: {dungeon['metadata']['seed']}")
@@ -485,17 +798,15 @@ def main():
 
     if args.preview:
         print("\nASCII Preview:")
-        symbols = {
-            "floor": ".",
-            "wall": "#",
-            "door": "+",
-            "trap": "^",
-            "stairs_up": "<",
-            "stairs_down": ">"
-        }
         grid = dungeon["grid"]
-        for row in grid[::2]:  # Sample every other row for terminal
-            print("".join(symbols.get(tile, "?") for tile in row[::2]))
+        if "tile_legend" in dungeon:
+            # Sample every other row and column for the terminal
+            for row in grid[::2]:
+                print(bytes(row[::2]).translate(_PREVIEW_TABLE).decode('ascii'))
+        else:
+            symbols = {tile.value: symbol for tile, symbol in PREVIEW_SYMBOLS.items()}
+            for row in grid[::2]:
+                print("".join(symbols.get(tile, "?") for tile in row[::2]))
 
 
 if __name__ == "__main__":
@@ -4,16 +4,30 @@ Realm of Eternity - Loot Table Generator
 Generates balanced loot tables for monsters, bosses, and activities.
 """
 
+import bisect
 import json
+import os
 import random
-import math
+import shutil
+import sys
+from array import array
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import repeat
 from enum import Enum
-from typing import List, Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib encoder
+    orjson = None
 
-class Rarity(Enum):
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class Rarity(str, Enum):
     ALWAYS = "always"      # 100% drop rate
     COMMON = "common"      # 1/1 to 1/10
     UNCOMMON = "uncommon"  # 1/10 to 1/50
@@ -23,7 +37,28 @@ class Rarity(Enum):
     LEGENDARY = "legendary"  # 1/5000+
 
 
-@dataclass
+# Lower bound (inclusive) of each rarity band, ascending; _RARITY_LABELS[i]
+# covers rates below _RARITY_THRESHOLDS[i]
+_RARITY_THRESHOLDS = (0.0002, 0.001, 0.005, 0.02, 0.1, 1.0)
+_RARITY_LABELS = ("legendary", "ultra_rare", "very_rare", "rare", "uncommon", "common", "always")
+
+# Minimum combat level for each bone tier past plain bones
+_BONE_LEVELS = (50, 100, 200)
+_BONE_TIERS = ("bones", "big_bones", "dragon_bones", "superior_dragon_bones")
+
+# Auto-generated rune drops: (item_id, quantity_min, quantity_max, rate denominator)
+_RUNE_BASE = (("chaos_rune", 10, 30, 15), ("death_rune", 5, 20, 20))
+_RUNE_60 = (("blood_rune", 5, 15, 30),)
+_RUNE_80 = (("soul_rune", 3, 10, 40),)
+
+
+@lru_cache(maxsize=512)
+def _fmt_rate(numerator: int, denominator: int) -> str:
+    """Format a drop rate as "num/denom", sharing the string across tables."""
+    return f"{numerator}/{denominator}"
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DropRate:
     numerator: int = 1
     denominator: int = 1
@@ -37,7 +72,7 @@ class DropRate:
         return f"{self.numerator}/{self.denominator}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LootItem:
     item_id: str
     quantity_min: int = 1
@@ -48,7 +83,7 @@ class LootItem:
     noted: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LootTableConfig:
     source_type: str  # monster, boss, skilling, minigame, clue
     source_id: str
@@ -61,32 +96,59 @@ class LootTableConfig:
     unique_drops: List[Dict] = field(default_factory=list)
     tertiary_drops: List[Dict] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Fill in per-drop defaults once, so the generator can index keys directly
+        self.guaranteed_drops = _with_defaults(self.guaranteed_drops, {"item_id": None, "quantity": 1})
+        self.main_drops = _with_defaults(
+            self.main_drops, {"item_id": None, "quantity_min": 1, "quantity_max": 1}, 10)
+        self.unique_drops = _with_defaults(
+            self.unique_drops, {"item_id": None, "quantity": 1, "broadcast": True}, 512)
+        self.tertiary_drops = _with_defaults(self.tertiary_drops, {"item_id": None, "quantity": 1}, 100)
+
+
+def _with_defaults(drops: List[Dict], defaults: Dict, denominator: Optional[int] = None) -> List[Dict]:
+    """Copy drop entries with missing keys (and rate num/denom) filled from defaults."""
+    if denominator is None:
+        return [{**defaults, **drop} for drop in drops]
+    return [
+        {**defaults, **drop, "rate": {"num": 1, "denom": denominator, **drop.get("rate", {})}}
+        for drop in drops
+    ]
+
+
+# Base item pools by category, shared with LootTableGenerator.COMMON_DROPS
+COMMON_DROPS = {
+    "bones": ["bones", "big_bones", "dragon_bones", "superior_dragon_bones"],
+    "hides": ["cowhide", "green_dragonhide", "blue_dragonhide", "black_dragonhide"],
+    "herbs": ["grimy_guam", "grimy_marrentill", "grimy_tarromin", "grimy_harralander",
+              "grimy_ranarr", "grimy_irit", "grimy_avantoe", "grimy_kwuarm",
+              "grimy_snapdragon", "grimy_cadantine", "grimy_lantadyme", "grimy_dwarf_weed",
+              "grimy_torstol"],
+    "seeds": ["potato_seed", "onion_seed", "cabbage_seed", "tomato_seed",
+              "ranarr_seed", "snapdragon_seed", "torstol_seed"],
+    "gems": ["uncut_sapphire", "uncut_emerald", "uncut_ruby", "uncut_diamond",
+             "uncut_dragonstone", "uncut_onyx"],
+    "runes": ["fire_rune", "water_rune", "air_rune", "earth_rune", "mind_rune",
+              "chaos_rune", "death_rune", "blood_rune", "soul_rune"],
+    "ores": ["copper_ore", "tin_ore", "iron_ore", "coal", "mithril_ore",
+             "adamantite_ore", "runite_ore"],
+    "bars": ["bronze_bar", "iron_bar", "steel_bar", "mithril_bar",
+             "adamantite_bar", "runite_bar"],
+    "coins": ["gold_coins"],
+    "food": ["raw_shark", "raw_anglerfish", "cooked_shark", "manta_ray"],
+    "potions": ["prayer_potion", "super_restore", "saradomin_brew"]
+}
+
+# Herb pool in level order; auto-generated drops index into it
+_HERBS = COMMON_DROPS["herbs"]
+_MAX_HERB_INDEX = len(_HERBS) - 1
+
 
 class LootTableGenerator:
     """Generates balanced loot tables based on source configuration."""
 
     # Base item pools by category
-    COMMON_DROPS = {
-        "bones": ["bones", "big_bones", "dragon_bones", "superior_dragon_bones"],
-        "hides": ["cowhide", "green_dragonhide", "blue_dragonhide", "black_dragonhide"],
-        "herbs": ["grimy_guam", "grimy_marrentill", "grimy_tarromin", "grimy_harralander",
-                  "grimy_ranarr", "grimy_irit", "grimy_avantoe", "grimy_kwuarm",
-                  "grimy_snapdragon", "grimy_cadantine", "grimy_lantadyme", "grimy_dwarf_weed",
-                  "grimy_torstol"],
-        "seeds": ["potato_seed", "onion_seed", "cabbage_seed", "tomato_seed",
-                  "ranarr_seed", "snapdragon_seed", "torstol_seed"],
-        "gems": ["uncut_sapphire", "uncut_emerald", "uncut_ruby", "uncut_diamond",
-                 "uncut_dragonstone", "uncut_onyx"],
-        "runes": ["fire_rune", "water_rune", "air_rune", "earth_rune", "mind_rune",
-                  "chaos_rune", "death_rune", "blood_rune", "soul_rune"],
-        "ores": ["copper_ore", "tin_ore", "iron_ore", "coal", "mithril_ore",
-                 "adamantite_ore", "runite_ore"],
-        "bars": ["bronze_bar", "iron_bar", "steel_bar", "mithril_bar",
-                 "adamantite_bar", "runite_bar"],
-        "coins": ["gold_coins"],
-        "food": ["raw_shark", "raw_anglerfish", "cooked_shark", "manta_ray"],
-        "potions": ["prayer_potion", "super_restore", "saradomin_brew"]
-    }
+    COMMON_DROPS = COMMON_DROPS
 
     RARE_DROP_TABLE = [
         {"item_id": "loop_half_of_key", "rate": DropRate(1, 128)},
@@ -109,59 +171,102 @@ class LootTableGenerator:
         {"item_id": "uncut_dragonstone", "rate": DropRate(1, 256)}
     ]
 
-    def __init__(self, config: LootTableConfig):
+    # Serialized table entries, copied into each table; only the access rate
+    # varies per config
+    _RDT_ITEMS = tuple(
+        {"item_id": item["item_id"], "rate": item["rate"].display}
+        for item in RARE_DROP_TABLE
+    )
+    _GDT_ITEMS = tuple(
+        {"item_id": item["item_id"], "rate": item["rate"].display}
+        for item in GEM_DROP_TABLE
+    )
+
+    def __init__(self, config: LootTableConfig, alias_tables: bool = False):
         self.config = config
+        # Also emit main_table_alias/unique_table_alias for O(1) runtime rolls
+        self.alias_tables = alias_tables
+        # Drop probabilities recorded as the main/unique tables are built,
+        # so statistics don't have to parse the "num/denom" strings back
+        self._main_probabilities = array('d')
+        self._unique_probabilities = array('d')
 
     def generate(self) -> Dict:
         """Generate a complete loot table."""
-        table = {
-            "metadata": {
-                "source_type": self.config.source_type,
-                "source_id": self.config.source_id,
-                "combat_level": self.config.combat_level,
-                "difficulty": self.config.difficulty
-            },
-            "guaranteed": self._generate_guaranteed_drops(),
-            "main_table": self._generate_main_drops(),
-            "tertiary": self._generate_tertiary_drops()
+        return dict(self._iter_sections())
+
+    def generate_streaming(self, fp: BinaryIO, pretty: bool = False) -> Dict:
+        """Write the loot table to a binary file one section at a time.
+
+        Only the section being encoded is held in memory. The bytes match
+        writing ``generate()``'s table; returns its metadata and statistics.
+        """
+        summary = {}
+        for key, section in _write_sections(fp, self._iter_sections(), pretty):
+            if key in ("metadata", "statistics"):
+                summary[key] = section
+        return summary
+
+    def _iter_sections(self) -> Iterator[Tuple[str, object]]:
+        """Yield the table's (key, section) pairs in output order."""
+        self._main_probabilities = array('d')
+        self._unique_probabilities = array('d')
+
+        yield "metadata", {
+            "source_type": self.config.source_type,
+            "source_id": self.config.source_id,
+            "combat_level": self.config.combat_level,
+            "difficulty": self.config.difficulty
         }
-
+        yield "guaranteed", self._generate_guaranteed_drops()
+        main_table = self._generate_main_drops()
+        main_ids = [drop["item_id"] for drop in main_table]
+        yield "main_table", main_table
+        del main_table
+        yield "tertiary", self._generate_tertiary_drops()
+
+        unique_ids = []
         if self.config.unique_drops:
-            table["unique_table"] = self._generate_unique_drops()
+            unique_table = self._generate_unique_drops()
+            unique_ids = [drop["item_id"] for drop in unique_table]
+            yield "unique_table", unique_table
+            del unique_table
 
         if self.config.rare_drop_table_access:
-            table["rare_drop_table"] = self._generate_rdt_access()
+            yield "rare_drop_table", self._generate_rdt_access()
 
         if self.config.gem_drop_table_access:
-            table["gem_drop_table"] = self._generate_gdt_access()
+            yield "gem_drop_table", self._generate_gdt_access()
 
-        # Calculate and add statistics
-        table["statistics"] = self._calculate_statistics(table)
+        if self.alias_tables:
+            yield "main_table_alias", _alias_table(main_ids, self._main_probabilities)
+            if unique_ids:
+                yield "unique_table_alias", _alias_table(unique_ids, self._unique_probabilities)
 
-        return table
+        # Statistics come last, once every drop's probability is recorded
+        yield "statistics", self._calculate_statistics()
 
     def _generate_guaranteed_drops(self) -> List[Dict]:
         """Generate guaranteed drops (always drop on kill)."""
         drops = []
+        has_bones = False
 
         # Add configured guaranteed drops
         for drop in self.config.guaranteed_drops:
+            item_id = drop["item_id"]
+            # Any *bones item (e.g. wyvern_bones) counts as bones
+            if not has_bones and item_id and item_id.endswith("bones"):
+                has_bones = True
             drops.append({
-                "item_id": drop.get("item_id"),
-                "quantity": drop.get("quantity", 1),
+                "item_id": item_id,
+                "quantity": drop["quantity"],
                 "rate": "1/1"
             })
 
         # Add bones based on combat level if not specified
-        if not any(d.get("item_id", "").endswith("bones") for d in drops):
-            if self.config.combat_level >= 200:
-                drops.append({"item_id": "superior_dragon_bones", "quantity": 1, "rate": "1/1"})
-            elif self.config.combat_level >= 100:
-                drops.append({"item_id": "dragon_bones", "quantity": 1, "rate": "1/1"})
-            elif self.config.combat_level >= 50:
-                drops.append({"item_id": "big_bones", "quantity": 1, "rate": "1/1"})
-            else:
-                drops.append({"item_id": "bones", "quantity": 1, "rate": "1/1"})
+        if not has_bones:
+            bones = _BONE_TIERS[bisect.bisect_right(_BONE_LEVELS, self.config.combat_level)]
+            drops.append({"item_id": bones, "quantity": 1, "rate": "1/1"})
 
         return drops
 
@@ -171,14 +276,16 @@ class LootTableGenerator:
 
         # Use configured main drops
         for drop in self.config.main_drops:
-            rate = drop.get("rate", {"num": 1, "denom": 10})
+            rate = drop["rate"]
+            num, denom = rate["num"], rate["denom"]
             drops.append({
-                "item_id": drop.get("item_id"),
-                "quantity_min": drop.get("quantity_min", 1),
-                "quantity_max": drop.get("quantity_max", 1),
-                "rate": f"{rate.get('num', 1)}/{rate.get('denom', 10)}",
-                "rarity": self._classify_rarity(rate.get("num", 1), rate.get("denom", 10))
+                "item_id": drop["item_id"],
+                "quantity_min": drop["quantity_min"],
+                "quantity_max": drop["quantity_max"],
+                "rate": _fmt_rate(num, denom),
+                "rarity": self._classify_rarity(num, denom)
             })
+            self._main_probabilities.append(num / denom)
 
         # Auto-generate additional drops based on combat level
         drops.extend(self._auto_generate_drops())
@@ -200,38 +307,38 @@ class LootTableGenerator:
             "rate": "3/10",
             "rarity": "common"
         })
+        self._main_probabilities.append(3 / 10)
 
         # Herbs - higher level = better herbs
-        herb_index = min(len(self.COMMON_DROPS["herbs"]) - 1, level // 10)
-        for i in range(max(0, herb_index - 2), herb_index + 1):
-            if i < len(self.COMMON_DROPS["herbs"]):
-                drops.append({
-                    "item_id": self.COMMON_DROPS["herbs"][i],
-                    "quantity_min": 1,
-                    "quantity_max": 3,
-                    "rate": f"1/{20 + i * 5}",
-                    "rarity": "uncommon" if i < 8 else "rare"
-                })
+        herb_index = min(_MAX_HERB_INDEX, level // 10)
+        first_herb = max(0, herb_index - 2)
+        for i, herb_id in enumerate(_HERBS[first_herb:herb_index + 1], first_herb):
+            drops.append({
+                "item_id": herb_id,
+                "quantity_min": 1,
+                "quantity_max": 3,
+                "rate": _fmt_rate(1, 20 + i * 5),
+                "rarity": "uncommon" if i < 8 else "rare"
+            })
+            self._main_probabilities.append(1 / (20 + i * 5))
 
         # Runes - scale with level
         if level >= 20:
-            rune_drops = [
-                ("chaos_rune", 10, 30, "1/15"),
-                ("death_rune", 5, 20, "1/20"),
-            ]
+            rune_drops = _RUNE_BASE
             if level >= 60:
-                rune_drops.append(("blood_rune", 5, 15, "1/30"))
+                rune_drops += _RUNE_60
             if level >= 80:
-                rune_drops.append(("soul_rune", 3, 10, "1/40"))
+                rune_drops += _RUNE_80
 
-            for rune_id, qmin, qmax, rate in rune_drops:
+            for rune_id, qmin, qmax, denom in rune_drops:
                 drops.append({
                     "item_id": rune_id,
                     "quantity_min": qmin,
                     "quantity_max": qmax,
-                    "rate": rate,
+                    "rate": _fmt_rate(1, denom),
                     "rarity": "uncommon"
                 })
+                self._main_probabilities.append(1 / denom)
 
         return drops
 
@@ -240,15 +347,17 @@ class LootTableGenerator:
         drops = []
 
         for unique in self.config.unique_drops:
-            rate = unique.get("rate", {"num": 1, "denom": 512})
+            rate = unique["rate"]
+            num, denom = rate["num"], rate["denom"]
             drops.append({
-                "item_id": unique.get("item_id"),
-                "quantity": unique.get("quantity", 1),
-                "rate": f"{rate.get('num', 1)}/{rate.get('denom', 512)}",
-                "rarity": self._classify_rarity(rate.get("num", 1), rate.get("denom", 512)),
-                "broadcast": unique.get("broadcast", True),
+                "item_id": unique["item_id"],
+                "quantity": unique["quantity"],
+                "rate": _fmt_rate(num, denom),
+                "rarity": self._classify_rarity(num, denom),
+                "broadcast": unique["broadcast"],
                 "collection_log": True
             })
+            self._unique_probabilities.append(num / denom)
 
         return drops
 
@@ -258,11 +367,11 @@ class LootTableGenerator:
 
         # Add configured tertiary drops
         for drop in self.config.tertiary_drops:
-            rate = drop.get("rate", {"num": 1, "denom": 100})
+            rate = drop["rate"]
             drops.append({
-                "item_id": drop.get("item_id"),
-                "quantity": drop.get("quantity", 1),
-                "rate": f"{rate.get('num', 1)}/{rate.get('denom', 100)}",
+                "item_id": drop["item_id"],
+                "quantity": drop["quantity"],
+                "rate": _fmt_rate(rate["num"], rate["denom"]),
                 "tertiary": True
             })
 
@@ -301,71 +410,32 @@ class LootTableGenerator:
     def _generate_rdt_access(self) -> Dict:
         """Generate rare drop table access configuration."""
         return {
-            "access_rate": f"1/{128 - min(100, self.config.combat_level)}",
-            "items": [
-                {
-                    "item_id": item["item_id"],
-                    "rate": item["rate"].display
-                }
-                for item in self.RARE_DROP_TABLE
-            ]
+            "access_rate": _fmt_rate(1, 128 - min(100, self.config.combat_level)),
+            "items": [dict(item) for item in self._RDT_ITEMS]
         }
 
     def _generate_gdt_access(self) -> Dict:
         """Generate gem drop table access configuration."""
         return {
-            "access_rate": f"1/{64 - min(50, self.config.combat_level // 2)}",
-            "items": [
-                {
-                    "item_id": item["item_id"],
-                    "rate": item["rate"].display
-                }
-                for item in self.GEM_DROP_TABLE
-            ]
+            "access_rate": _fmt_rate(1, 64 - min(50, self.config.combat_level // 2)),
+            "items": [dict(item) for item in self._GDT_ITEMS]
         }
 
     def _classify_rarity(self, numerator: int, denominator: int) -> str:
         """Classify drop rarity based on rate."""
-        rate = numerator / denominator
-
-        if rate >= 1:
-            return "always"
-        elif rate >= 0.1:
-            return "common"
-        elif rate >= 0.02:
-            return "uncommon"
-        elif rate >= 0.005:
-            return "rare"
-        elif rate >= 0.001:
-            return "very_rare"
-        elif rate >= 0.0002:
-            return "ultra_rare"
-        else:
-            return "legendary"
+        return _RARITY_LABELS[bisect.bisect_right(_RARITY_THRESHOLDS, numerator / denominator)]
 
-    def _calculate_statistics(self, table: Dict) -> Dict:
+    def _calculate_statistics(self) -> Dict:
         """Calculate statistics about the loot table."""
-        def parse_rate(rate_str: str) -> float:
-            parts = rate_str.split("/")
-            return int(parts[0]) / int(parts[1])
-
-        total_value = 0
-        unique_count = len(table.get("unique_table", []))
-        main_count = len(table.get("main_table", []))
+        unique_count = len(self._unique_probabilities)
+        main_count = len(self._main_probabilities)
 
         # Expected drops per kill
-        expected_drops = sum(
-            parse_rate(drop.get("rate", "1/1"))
-            for drop in table.get("main_table", [])
-        )
+        expected_drops = sum(self._main_probabilities)
 
         # Unique dry rate (kills to expect all uniques)
-        if unique_count > 0:
-            unique_rates = [
-                1 / parse_rate(drop.get("rate", "1/512"))
-                for drop in table.get("unique_table", [])
-            ]
-            avg_dry_rate = sum(unique_rates) / len(unique_rates)
+        if unique_count:
+            avg_dry_rate = sum(map((1.0).__truediv__, self._unique_probabilities)) / unique_count
         else:
             avg_dry_rate = 0
 
@@ -374,38 +444,215 @@ class LootTableGenerator:
             "unique_drop_count": unique_count,
             "expected_drops_per_kill": round(expected_drops, 2),
             "average_unique_dry_rate": round(avg_dry_rate, 0),
-            "has_rdt_access": "rare_drop_table" in table,
-            "has_gdt_access": "gem_drop_table" in table
+            "has_rdt_access": bool(self.config.rare_drop_table_access),
+            "has_gdt_access": bool(self.config.gem_drop_table_access)
         }
 
 
-def generate_loot_table(config_path: Path, output_path: Path) -> Dict:
-    """Generate a loot table from configuration file."""
-    with open(config_path) as f:
-        config_data = json.load(f)
+def _alias_table(item_ids: List[str], probabilities: Iterable[float]) -> Dict:
+    """Build a Walker alias table (Vose's method) for one roll on a drop table.
+
+    If the rates sum to less than 1, the remainder is a trailing ``None``
+    item meaning no drop; rates summing past 1 are scaled down to fit.
+    """
+    items = list(item_ids)
+    weights = list(probabilities)
+    total = sum(weights)
+    if total < 1:
+        items.append(None)
+        weights.append(1 - total)
+        total = 1
+    n = len(weights)
+    scaled = [weight * n / total for weight in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1]
+    large = [i for i, p in enumerate(scaled) if p >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less], alias[less] = scaled[less], more
+        scaled[more] += scaled[less] - 1
+        (small if scaled[more] < 1 else large).append(more)
+    # Whatever is left over is 1 up to rounding error and keeps prob 1.0
+    return {"items": items, "prob": prob, "alias": alias}
+
+
+def roll_alias(table: Dict, rng: random.Random = random) -> Optional[str]:
+    """Roll once on an alias table from ``_alias_table``; ``None`` is no drop."""
+    column = int(rng.random() * len(table["prob"]))
+    if rng.random() < table["prob"][column]:
+        return table["items"][column]
+    return table["items"][table["alias"][column]]
+
+
+def _encode(value, pretty: bool) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_sections(fp: BinaryIO, sections: Iterable[Tuple[str, object]],
+                    pretty: bool = False) -> Iterator[Tuple[str, object]]:
+    """Write (key, section) pairs as one JSON object, passing each pair on.
+
+    Each section is encoded on its own (and re-indented one level when
+    ``pretty``), which gives the same bytes as encoding the whole object at once.
+    """
+    first, separator, colon = (b'{\n  ', b',\n  ', b': ') if pretty else (b'{', b',', b':')
+    lead = first
+    for key, section in sections:
+        data = _encode(section, pretty)
+        if pretty:
+            data = data.replace(b'\n', b'\n  ')
+        fp.write(lead + _encode(key, pretty) + colon + data)
+        lead = separator
+        yield key, section
+    if lead is first:
+        fp.write(b'{}')
+    else:
+        fp.write(b'\n}' if pretty else b'}')
+
+
+def _write_table(table: Dict, output_path: Path, pretty: bool = False):
+    """Write the table as compact JSON, or indented with ``pretty``."""
+    with open(output_path, 'wb') as f:
+        for _ in _write_sections(f, table.items(), pretty):
+            pass
+
+
+def _load_config(config_path: Path) -> Dict:
+    """Parse a loot table config file, with orjson when available."""
+    data = Path(config_path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
-    config = LootTableConfig(**config_data)
-    generator = LootTableGenerator(config)
-    table = generator.generate()
 
-    with open(output_path, 'w') as f:
-        json.dump(table, f, indent=2)
+def generate_loot_table(config_path: Path, output_path: Path, alias_tables: bool = False,
+                        pretty: bool = False) -> Dict:
+    """Generate a loot table from configuration file."""
+    config = LootTableConfig(**_load_config(config_path))
+    table = LootTableGenerator(config, alias_tables).generate()
+
+    _write_table(table, output_path, pretty)
 
     return table
 
 
+def _generate_one(config_data: Dict, output_paths: List[Path], alias_tables: bool = False,
+                  pretty: bool = False) -> Dict:
+    """Generate one loot table and write it to every path in ``output_paths``.
+
+    Returns its metadata and statistics.
+    """
+    config = LootTableConfig(**config_data)
+    first, *copies = output_paths
+    with open(first, 'wb') as f:
+        summary = LootTableGenerator(config, alias_tables).generate_streaming(f, pretty)
+    for output_path in copies:
+        shutil.copyfile(first, output_path)
+    return dict(summary["metadata"], **summary["statistics"])
+
+
+def _batch_output_paths(config_paths: List[Path], output_dir: Path) -> List[Path]:
+    """Name each config's table ``<config stem>.json`` in ``output_dir``.
+
+    Raises ValueError if two different configs would get the same name.
+    """
+    claimed: Dict[Path, Path] = {}
+    output_paths = []
+    for path in config_paths:
+        output_path = output_dir / f"{path.stem}.json"
+        other = claimed.setdefault(output_path, path)
+        if other != path:
+            raise ValueError(f"{other} and {path} would both be written to {output_path}")
+        output_paths.append(output_path)
+    return output_paths
+
+
+def generate_batch(config_paths: List[Path], output_dir: Path,
+                   workers: Optional[int] = None, alias_tables: bool = False,
+                   pretty: bool = False) -> List[Dict]:
+    """Generate a loot table per config file in parallel worker processes.
+
+    Each table is written to ``output_dir`` as ``<config stem>.json`` by a
+    worker; only its metadata and statistics are sent back, in input order.
+    Identical configs (e.g. from templates) are generated once and the table
+    is copied to each of their outputs. Raises ValueError if two configs
+    share a stem, as their tables would overwrite each other.
+    """
+    # Only batch runs need the process pool; keep it out of plain imports
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not config_paths:
+        return []
+    batch_outputs = _batch_output_paths(config_paths, output_dir)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Group output paths by config content; generation is deterministic
+    unique: Dict[str, Tuple[Dict, List[Path]]] = {}
+    keys = []
+    for path, output_path in zip(config_paths, batch_outputs):
+        config_data = _load_config(path)
+        key = json.dumps(config_data)
+        group = unique.setdefault(key, (config_data, []))[1]
+        if output_path not in group:
+            group.append(output_path)
+        keys.append(key)
+    configs, output_paths = zip(*unique.values())
+
+    options = (repeat(alias_tables), repeat(pretty))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(unique) == 1:
+        stats = list(map(_generate_one, configs, output_paths, *options))
+    else:
+        chunksize = max(1, len(unique) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            stats = list(pool.map(_generate_one, configs, output_paths, *options,
+                                  chunksize=chunksize))
+
+    by_key = dict(zip(unique, stats))
+    return [dict(by_key[key]) for key in keys]
+
+
 def main():
     import argparse
+    import glob
 
     parser = argparse.ArgumentParser(description="Generate loot tables")
     parser.add_argument("--config", type=Path, help="Loot table configuration")
     parser.add_argument("--output", type=Path, default=Path("loot_table.json"))
     parser.add_argument("--preview", action="store_true", help="Print preview")
+    parser.add_argument("--batch", nargs="+", metavar="GLOB",
+                        help="Generate a table for every config file matching these patterns")
+    parser.add_argument("--output-dir", type=Path, default=Path("loot_tables"),
+                        help="Output directory for --batch tables (written as CONFIG_STEM.json)")
+    parser.add_argument("--workers", type=int,
+                        help="Worker processes for --batch (default: one per CPU)")
+    parser.add_argument("--alias-tables", action="store_true",
+                        help="Also emit Walker alias tables for constant-time drop rolls")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the output JSON for reading")
 
     args = parser.parse_args()
 
+    if args.batch:
+        config_paths = sorted({Path(p) for pattern in args.batch for p in glob.glob(pattern)})
+        if not config_paths:
+            parser.error(f"no config files match {' '.join(args.batch)}")
+        try:
+            _batch_output_paths(config_paths, args.output_dir)
+        except ValueError as e:
+            parser.error(str(e))
+        results = generate_batch(config_paths, args.output_dir, args.workers, args.alias_tables,
+                                 args.pretty)
+        for config_path, stats in zip(config_paths, results):
+            print(f"{args.output_dir / (config_path.stem + '.json')}: {stats['source_id']}, "
+                  f"{stats['main_drop_count']} main drops, {stats['unique_drop_count']} uniques")
+        return
+
     if args.config and args.config.exists():
-        table = generate_loot_table(args.config, args.output)
+        table = generate_loot_table(args.config, args.output, args.alias_tables, args.pretty)
     else:
         # Example: Generate a boss loot table
         config = LootTableConfig(
@@ -425,11 +672,10 @@ def main():
             gem_drop_table_access=True
         )
 
-        generator = LootTableGenerator(config)
+        generator = LootTableGenerator(config, args.alias_tables)
         table = generator.generate()
 
-        with open(args.output, 'w') as f:
-            json.dump(table, f, indent=2)
+        _write_table(table, args.output, args.pretty)
 
     print(f"Generated loot table for: {table['metadata']['source_id']}")
     print(f"Output: {args.output}")
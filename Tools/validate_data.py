@@ -13,194 +13,376 @@ Usage:
     python validate_data.py [--fix] [--verbose]
 """
 
+import copy
+import hashlib
 import json
 import os
+import pickle
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Any, Optional, Tuple
+from typing import AbstractSet, Dict, List, Any, Literal, Optional, Tuple
+from itertools import chain
 from dataclasses import dataclass, field
-from enum import Enum
 
-class Severity(Enum):
-    ERROR = "ERROR"
-    WARNING = "WARNING"
-    INFO = "INFO"
-
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib parser
+    orjson = None
+
+# Threads used to read and parse the data files in collect_ids
+FILE_LOAD_THREADS = 8
+# Threads used to run the validate_* passes in run_validation
+VALIDATOR_THREADS = 4
+
+# Data files read by collect_ids, keyed as in GameDataValidator.data and
+# given relative to the data directory; every JSON file in RECIPES_DIR is
+# read as well
+DATA_FILES = {
+    'items': "Items/items.json",
+    'friendly_npcs': "NPCs/friendly.json",
+    'enemies': "NPCs/enemies.json",
+    'zones': "World/zones.json",
+    'quests': "Quests/quests.json",
+    'abilities': "Combat/abilities.json",
+    'achievements': "Achievements/achievements.json",
+    'loot_tables': "NPCs/loot_tables.json",
+}
+RECIPES_DIR = "Recipes"
+
+# Where --cache keeps parsed data files between runs
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'roe-validator'
+
+# Skills that are always valid; skills named by recipes are added to these
+BASE_SKILLS = frozenset({
+    'melee', 'ranged', 'magic', 'defense', 'hitpoints', 'prayer',
+    'mining', 'smithing', 'woodcutting', 'firemaking', 'fishing',
+    'cooking', 'farming', 'herblore', 'fletching', 'crafting',
+    'runecrafting', 'construction', 'agility', 'thieving', 'beastslaying',
+    'summoning', 'dungeoneering', 'divination', 'invention',
+})
+
+# Lists of enemies.json validated as enemies, in report order
+ENEMY_CATEGORIES = ('enemies', 'worldBosses', 'dungeonBosses')
+
+# Drop lists checked for item references in each kind of loot table
+ENEMY_DROP_TYPES = ('mainDrops', 'uncommonDrops', 'rareDrops')
+BOSS_DROP_TYPES = ('guaranteedDrops', 'commonDrops', 'rareDrops', 'ultraRareDrops')
+
+# Fields every entry of each kind must have
+ITEM_REQUIRED_FIELDS = ('id', 'name', 'type')
+ENEMY_REQUIRED_FIELDS = ('id', 'name', 'level', 'health')
+
+# Result and report records are slotted where @dataclass accepts slots=
+# (3.10+); older interpreters get regular classes
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+SeverityLevel = Literal['ERROR', 'WARNING', 'INFO']
+
+class Severity:
+    """Severity levels, as plain strings so results compare and pickle cheaply."""
+    ERROR: SeverityLevel = "ERROR"
+    WARNING: SeverityLevel = "WARNING"
+    INFO: SeverityLevel = "INFO"
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     file: str
     message: str
-    severity: Severity
+    severity: SeverityLevel
     path: str = ""
     suggestion: str = ""
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationReport:
     results: List[ValidationResult] = field(default_factory=list)
+    # Results split by severity as they are added, in the order added
+    errors: List[ValidationResult] = field(default_factory=list, init=False, repr=False)
+    warnings: List[ValidationResult] = field(default_factory=list, init=False, repr=False)
+    infos: List[ValidationResult] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        for result in self.results:
+            self._bucket(result).append(result)
+
+    def _bucket(self, result: ValidationResult) -> List[ValidationResult]:
+        if result.severity == Severity.ERROR:
+            return self.errors
+        if result.severity == Severity.WARNING:
+            return self.warnings
+        return self.infos
 
     def add(self, result: ValidationResult):
         self.results.append(result)
+        self._bucket(result).append(result)
 
     def has_errors(self) -> bool:
-        return any(r.severity == Severity.ERROR for r in self.results)
+        return bool(self.errors)
 
     def error_count(self) -> int:
-        return sum(1 for r in self.results if r.severity == Severity.ERROR)
+        return len(self.errors)
 
     def warning_count(self) -> int:
-        return sum(1 for r in self.results if r.severity == Severity.WARNING)
+        return len(self.warnings)
+
+def _intern_id(value: Any) -> Any:
+    """Intern string IDs so repeated IDs share one object; other values pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _file_stamp(file_path: Path) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_cache(cache_path: Path, file_path: Path) -> Any:
+    """Return the cached parse of ``file_path``, or None if missing or stale."""
+    try:
+        with open(cache_path, 'rb') as f:
+            stamp, data = pickle.load(f)
+        if stamp == _file_stamp(file_path):
+            return data
+    except Exception:  # a missing or unreadable entry is just a miss
+        pass
+    return None
+
+
+def _write_cache(cache_path: Path, file_path: Path, data: Any):
+    """Store a parsed file; replaces the previous entry for the same file."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((_file_stamp(file_path), data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # caching is best-effort
+
 
 class GameDataValidator:
     """Validates all game data files for consistency and correctness."""
 
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: str, cache_dir: Optional[Path] = None):
         self.data_path = Path(data_path)
         self.report = ValidationReport()
-
-        # Caches for cross-reference validation
-        self.item_ids: Set[str] = set()
-        self.npc_ids: Set[str] = set()
-        self.enemy_ids: Set[str] = set()
-        self.zone_ids: Set[str] = set()
-        self.quest_ids: Set[str] = set()
-        self.ability_ids: Set[str] = set()
-        self.recipe_ids: Set[str] = set()
-        self.achievement_ids: Set[str] = set()
-        self.dialogue_ids: Set[str] = set()
-        self.loot_table_ids: Set[str] = set()
-        self.skill_names: Set[str] = set()
-
-        # All data loaded
+        # Parsed files are reused from here while their mtime and size match
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        # Caches for cross-reference validation; filled by collect_ids,
+        # which freezes them once every file has been read
+        self.item_ids: AbstractSet[str] = set()
+        self.npc_ids: AbstractSet[str] = set()
+        self.enemy_ids: AbstractSet[str] = set()
+        self.zone_ids: AbstractSet[str] = set()
+        self.quest_ids: AbstractSet[str] = set()
+        self.ability_ids: AbstractSet[str] = set()
+        self.recipe_ids: AbstractSet[str] = set()
+        self.achievement_ids: AbstractSet[str] = set()
+        self.dialogue_ids: AbstractSet[str] = set()
+        self.loot_table_ids: AbstractSet[str] = set()
+        self.skill_names: AbstractSet[str] = set()
+        # Suggestion for unknown-skill warnings, built once skill_names is final
+        self._skills_suggestion = ""
+        # (file name, recipes) for each loaded recipe file, in directory order;
+        # recipes are the (category, index, recipe) entries that are dicts
+        self._recipe_files: List[Tuple[str, List[Tuple[str, int, Dict]]]] = []
+
+        # Loaded documents that the validate_* passes read
         self.data: Dict[str, Any] = {}
 
     def load_json(self, file_path: Path) -> Optional[Dict]:
         """Load and parse a JSON file."""
+        data, error = self._read_json(file_path)
+        if error:
+            self.report.add(error)
+        return data
+
+    def _read_json(self, file_path: Path) -> Tuple[Optional[Dict], Optional[ValidationResult]]:
+        """Parse a JSON file without touching the report; safe to call from threads."""
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(file_path)
+            data = _read_cache(cache_path, file_path)
+            if data is not None:
+                return data, None
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            self.report.add(ValidationResult(
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except json.JSONDecodeError as e:  # orjson's error subclasses it, with lineno/colno
+            return None, ValidationResult(
                 file=str(file_path),
                 message=f"Invalid JSON syntax: {e}",
                 severity=Severity.ERROR,
                 path=f"line {e.lineno}, column {e.colno}"
-            ))
-            return None
+            )
         except Exception as e:
-            self.report.add(ValidationResult(
+            return None, ValidationResult(
                 file=str(file_path),
                 message=f"Error reading file: {e}",
                 severity=Severity.ERROR
-            ))
-            return None
+            )
+        if self.cache_dir is not None:
+            _write_cache(cache_path, file_path, data)
+        return data, None
+
+    def _cache_path(self, file_path: Path) -> Path:
+        """One cache entry per source file, named by its resolved path."""
+        key = str(Path(file_path).resolve()).encode('utf-8')
+        return self.cache_dir / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.pkl"
+
+    def _load_files(self, sources: Dict[str, str]) -> Dict[str, Dict]:
+        """Load the files in ``sources`` concurrently, keyed like ``sources``.
+
+        Parse errors are added to the report on this thread in ``sources``
+        order, so the report does not depend on which file finishes first.
+        """
+        if not sources:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(FILE_LOAD_THREADS, len(sources))) as pool:
+            parsed = list(pool.map(self._read_json, sources.values()))
+
+        loaded = {}
+        for key, (data, error) in zip(sources, parsed):
+            if error:
+                self.report.add(error)
+            if data:
+                loaded[key] = data
+        return loaded
+
+    def _report_duplicate(self, file_path: str, kind: str, entry_id: str, path: str):
+        self.report.add(ValidationResult(
+            file=file_path,
+            message=f"Duplicate {kind} ID: {entry_id}",
+            severity=Severity.ERROR,
+            path=path
+        ))
+
+    def _report_missing_field(self, file_path: str, field_name: str, where: str, path: str):
+        self.report.add(ValidationResult(
+            file=file_path,
+            message=f"Missing required field '{field_name}' in {where}",
+            severity=Severity.ERROR,
+            path=path
+        ))
 
     def collect_ids(self):
         """First pass: collect all IDs for cross-reference validation."""
+        root = str(self.data_path)
+        sources = {}
+        for key, rel in DATA_FILES.items():
+            file_path = os.path.join(root, *rel.split('/'))
+            if os.path.isfile(file_path):
+                sources[key] = file_path
+        recipe_names = {}
+        try:
+            with os.scandir(os.path.join(root, RECIPES_DIR)) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.json') and entry.is_file():
+                        key = f'recipes_{os.path.splitext(name)[0]}'
+                        sources[key] = entry.path
+                        recipe_names[key] = name
+        except FileNotFoundError:
+            pass
+
+        # All files are read up front on a thread pool; IDs are then
+        # collected here in the same order as before
+        loaded = self._load_files(sources)
 
         # Items
-        items_file = self.data_path / "Items" / "items.json"
-        if items_file.exists():
-            data = self.load_json(items_file)
-            if data:
-                self.data['items'] = data
-                for item in data.get('items', []):
-                    self.item_ids.add(item.get('id', ''))
-
-        # NPCs
-        friendly_file = self.data_path / "Npcs" / "friendly.json"
-        if friendly_file.exists():
-            data = self.load_json(friendly_file)
-            if data:
-                self.data['friendly_npcs'] = data
-                for npc in data.get('npcs', []):
-                    self.npc_ids.add(npc.get('id', ''))
+        data = loaded.get('items')
+        if data:
+            self.data['items'] = data
+            for item in data.get('items', []):
+                self.item_ids.add(_intern_id(item.get('id', '')))
+
+        # NPCs (only the IDs are used, so the document is not kept)
+        data = loaded.get('friendly_npcs')
+        if data:
+            for npc in data.get('npcs', []):
+                self.npc_ids.add(_intern_id(npc.get('id', '')))
 
         # Enemies
-        enemies_file = self.data_path / "Npcs" / "enemies.json"
-        if enemies_file.exists():
-            data = self.load_json(enemies_file)
-            if data:
-                self.data['enemies'] = data
-                for enemy in data.get('enemies', []):
-                    self.enemy_ids.add(enemy.get('id', ''))
-                for boss in data.get('worldBosses', []):
-                    self.enemy_ids.add(boss.get('id', ''))
-                for boss in data.get('dungeonBosses', []):
-                    self.enemy_ids.add(boss.get('id', ''))
+        data = loaded.get('enemies')
+        if data:
+            self.data['enemies'] = data
+            for enemy in data.get('enemies', []):
+                self.enemy_ids.add(_intern_id(enemy.get('id', '')))
+            for boss in data.get('worldBosses', []):
+                self.enemy_ids.add(_intern_id(boss.get('id', '')))
+            for boss in data.get('dungeonBosses', []):
+                self.enemy_ids.add(_intern_id(boss.get('id', '')))
 
         # Zones
-        zones_file = self.data_path / "World" / "zones.json"
-        if zones_file.exists():
-            data = self.load_json(zones_file)
-            if data:
-                self.data['zones'] = data
-                for region in data.get('regions', []):
-                    for zone in region.get('zones', []):
-                        self.zone_ids.add(zone.get('id', ''))
+        data = loaded.get('zones')
+        if data:
+            self.data['zones'] = data
+            for region in data.get('regions', []):
+                for zone in region.get('zones', []):
+                    self.zone_ids.add(_intern_id(zone.get('id', '')))
 
         # Quests
-        quests_file = self.data_path / "Quests" / "quests.json"
-        if quests_file.exists():
-            data = self.load_json(quests_file)
-            if data:
-                self.data['quests'] = data
-                for quest in data.get('quests', []):
-                    self.quest_ids.add(quest.get('id', ''))
-
-        # Abilities
-        abilities_file = self.data_path / "Combat" / "abilities.json"
-        if abilities_file.exists():
-            data = self.load_json(abilities_file)
-            if data:
-                self.data['abilities'] = data
-                for category in ['melee', 'ranged', 'magic', 'defense', 'prayer']:
-                    for ability in data.get(category, []):
-                        self.ability_ids.add(ability.get('id', ''))
+        data = loaded.get('quests')
+        if data:
+            self.data['quests'] = data
+            for quest in data.get('quests', []):
+                self.quest_ids.add(_intern_id(quest.get('id', '')))
+
+        # Abilities (only the IDs are used, so the document is not kept)
+        data = loaded.get('abilities')
+        if data:
+            for category in ['melee', 'ranged', 'magic', 'defense', 'prayer']:
+                for ability in data.get(category, []):
+                    self.ability_ids.add(_intern_id(ability.get('id', '')))
 
         # Achievements
-        achievements_file = self.data_path / "Achievements" / "achievements.json"
-        if achievements_file.exists():
-            data = self.load_json(achievements_file)
-            if data:
-                self.data['achievements'] = data
-                for achievement in data.get('achievements', []):
-                    self.achievement_ids.add(achievement.get('id', ''))
+        data = loaded.get('achievements')
+        if data:
+            self.data['achievements'] = data
+            for achievement in data.get('achievements', []):
+                self.achievement_ids.add(_intern_id(achievement.get('id', '')))
 
         # Loot Tables
-        loot_file = self.data_path / "Npcs" / "loot_tables.json"
-        if loot_file.exists():
-            data = self.load_json(loot_file)
-            if data:
-                self.data['loot_tables'] = data
-                for table_id in data.get('enemyLootTables', {}).keys():
-                    self.loot_table_ids.add(table_id)
-                for table_id in data.get('bossLootTables', {}).keys():
-                    self.loot_table_ids.add(table_id)
+        data = loaded.get('loot_tables')
+        if data:
+            self.data['loot_tables'] = data
+            for table_id in data.get('enemyLootTables', {}).keys():
+                self.loot_table_ids.add(table_id)
+            for table_id in data.get('bossLootTables', {}).keys():
+                self.loot_table_ids.add(table_id)
 
         # Recipes
-        recipes_path = self.data_path / "Recipes"
-        if recipes_path.exists():
-            for recipe_file in recipes_path.glob("*.json"):
-                data = self.load_json(recipe_file)
-                if data:
-                    self.data[f'recipes_{recipe_file.stem}'] = data
-                    for key, recipes in data.items():
-                        if isinstance(recipes, list):
-                            for recipe in recipes:
-                                if isinstance(recipe, dict) and 'id' in recipe:
-                                    self.recipe_ids.add(recipe.get('id', ''))
-                                    if 'skill' in recipe:
-                                        self.skill_names.add(recipe['skill'])
-
-        # Define valid skills
-        self.skill_names.update([
-            'melee', 'ranged', 'magic', 'defense', 'hitpoints', 'prayer',
-            'mining', 'smithing', 'woodcutting', 'firemaking', 'fishing',
-            'cooking', 'farming', 'herblore', 'fletching', 'crafting',
-            'runecrafting', 'construction', 'agility', 'thieving', 'beastslaying',
-            'summoning', 'dungeoneering', 'divination', 'invention'
-        ])
+        # Recipe files are flattened here once so validate_recipes can skip
+        # the shape checks
+        self._recipe_files = []
+        for key, name in recipe_names.items():
+            data = loaded.get(key)
+            if data:
+                self.data[key] = data
+                entries = [
+                    (category, idx, recipe)
+                    for category, recipes in data.items() if isinstance(recipes, list)
+                    for idx, recipe in enumerate(recipes) if isinstance(recipe, dict)
+                ]
+                self._recipe_files.append((name, entries))
+                for _, _, recipe in entries:
+                    if 'id' in recipe:
+                        self.recipe_ids.add(_intern_id(recipe.get('id', '')))
+                        if 'skill' in recipe:
+                            self.skill_names.add(_intern_id(recipe['skill']))
+
+        # Add the skills that are valid without a recipe
+        self.skill_names |= BASE_SKILLS
+        self._skills_suggestion = f"Valid skills: {', '.join(sorted(self.skill_names))}"
+
+        # The validators only read these from here on
+        for name in ('item_ids', 'npc_ids', 'enemy_ids', 'zone_ids', 'quest_ids', 'ability_ids',
+                     'recipe_ids', 'achievement_ids', 'dialogue_ids', 'loot_table_ids', 'skill_names'):
+            setattr(self, name, frozenset(getattr(self, name)))
 
     def validate_items(self):
         """Validate items.json structure and references."""
@@ -216,24 +398,13 @@ class GameDataValidator:
 
             # Check for duplicate IDs
             if item_id in seen_ids:
-                self.report.add(ValidationResult(
-                    file=file_path,
-                    message=f"Duplicate item ID: {item_id}",
-                    severity=Severity.ERROR,
-                    path=f"items[{idx}]"
-                ))
+                self._report_duplicate(file_path, "item", item_id, f"items[{idx}]")
             seen_ids.add(item_id)
 
             # Required fields
-            required = ['id', 'name', 'type']
-            for field in required:
-                if field not in item:
-                    self.report.add(ValidationResult(
-                        file=file_path,
-                        message=f"Missing required field '{field}' in item",
-                        severity=Severity.ERROR,
-                        path=f"items[{idx}]"
-                    ))
+            for field_name in ITEM_REQUIRED_FIELDS:
+                if field_name not in item:
+                    self._report_missing_field(file_path, field_name, "item", f"items[{idx}]")
 
             # Validate equipment requirements
             if 'requirements' in item:
@@ -245,7 +416,7 @@ class GameDataValidator:
                             message=f"Unknown skill '{skill}' in requirements",
                             severity=Severity.WARNING,
                             path=f"items[{idx}].requirements",
-                            suggestion=f"Valid skills: {', '.join(sorted(self.skill_names))}"
+                            suggestion=self._skills_suggestion
                         ))
                     if not isinstance(level, int) or level < 1 or level > 120:
                         self.report.add(ValidationResult(
@@ -261,38 +432,29 @@ class GameDataValidator:
             return
 
         enemies_data = self.data['enemies']
-        file_path = "Data/Npcs/enemies.json"
+        file_path = "Data/NPCs/enemies.json"
         seen_ids = set()
 
-        all_enemies = (
-            enemies_data.get('enemies', []) +
-            enemies_data.get('worldBosses', []) +
-            enemies_data.get('dungeonBosses', [])
+        # Index within each list, so paths point at the entry's real location
+        all_enemies = chain.from_iterable(
+            ((category, idx, enemy) for idx, enemy in enumerate(enemies_data.get(category, [])))
+            for category in ENEMY_CATEGORIES
         )
 
-        for idx, enemy in enumerate(all_enemies):
+        for category, idx, enemy in all_enemies:
             enemy_id = enemy.get('id', '')
+            entry_path = f"{category}[{idx}]"
 
             # Check for duplicate IDs
             if enemy_id in seen_ids:
-                self.report.add(ValidationResult(
-                    file=file_path,
-                    message=f"Duplicate enemy ID: {enemy_id}",
-                    severity=Severity.ERROR,
-                    path=f"enemies[{idx}]"
-                ))
+                self._report_duplicate(file_path, "enemy", enemy_id, entry_path)
             seen_ids.add(enemy_id)
 
             # Required fields
-            required = ['id', 'name', 'level', 'health']
-            for field in required:
-                if field not in enemy:
-                    self.report.add(ValidationResult(
-                        file=file_path,
-                        message=f"Missing required field '{field}' in enemy {enemy_id}",
-                        severity=Severity.ERROR,
-                        path=f"enemies[{idx}]"
-                    ))
+            for field_name in ENEMY_REQUIRED_FIELDS:
+                if field_name not in enemy:
+                    self._report_missing_field(file_path, field_name, f"enemy {enemy_id}",
+                                               entry_path)
 
             # Validate loot table reference
             loot_ref = enemy.get('lootTableRef', '')
@@ -301,7 +463,7 @@ class GameDataValidator:
                     file=file_path,
                     message=f"Invalid loot table reference: {loot_ref}",
                     severity=Severity.WARNING,
-                    path=f"enemies[{idx}].lootTableRef",
+                    path=f"{entry_path}.lootTableRef",
                     suggestion=f"Enemy: {enemy_id}"
                 ))
 
@@ -312,7 +474,7 @@ class GameDataValidator:
                     file=file_path,
                     message=f"Missing stats for enemy {enemy_id}",
                     severity=Severity.WARNING,
-                    path=f"enemies[{idx}].stats"
+                    path=f"{entry_path}.stats"
                 ))
 
     def validate_loot_tables(self):
@@ -321,10 +483,25 @@ class GameDataValidator:
             return
 
         loot_data = self.data['loot_tables']
-        file_path = "Data/Npcs/loot_tables.json"
+        file_path = "Data/NPCs/loot_tables.json"
+        shared_pools = loot_data.get('sharedPools', {})
+        enemy_tables = loot_data.get('enemyLootTables', {})
+        boss_tables = loot_data.get('bossLootTables', {})
+
+        # Gather every referenced ID and diff it against the known items in
+        # one set operation; the per-reference walk below only runs to
+        # report the references that turned out to be unknown
+        refs = {item.get('itemId', '') for pool in shared_pools.values()
+                for item in pool.get('items', [])}
+        for tables, drop_types in ((enemy_tables, ENEMY_DROP_TYPES), (boss_tables, BOSS_DROP_TYPES)):
+            refs.update(drop['itemId'] for table in tables.values() for drop_type in drop_types
+                        for drop in table.get(drop_type, []) if 'itemId' in drop)
+        unknown = refs - self.item_ids
+        if not unknown:
+            return
 
         def check_item_ref(item_id: str, path: str):
-            if item_id not in self.item_ids:
+            if item_id in unknown:
                 self.report.add(ValidationResult(
                     file=file_path,
                     message=f"Unknown item reference: {item_id}",
@@ -334,48 +511,44 @@ class GameDataValidator:
                 ))
 
         # Check shared pools
-        for pool_name, pool in loot_data.get('sharedPools', {}).items():
+        for pool_name, pool in shared_pools.items():
             for idx, item in enumerate(pool.get('items', [])):
                 check_item_ref(item.get('itemId', ''), f"sharedPools.{pool_name}.items[{idx}]")
 
         # Check enemy loot tables
-        for table_name, table in loot_data.get('enemyLootTables', {}).items():
-            for drop_type in ['mainDrops', 'uncommonDrops', 'rareDrops']:
+        for table_name, table in enemy_tables.items():
+            for drop_type in ENEMY_DROP_TYPES:
                 for idx, drop in enumerate(table.get(drop_type, [])):
                     if 'itemId' in drop:
                         check_item_ref(drop['itemId'], f"enemyLootTables.{table_name}.{drop_type}[{idx}]")
 
         # Check boss loot tables
-        for table_name, table in loot_data.get('bossLootTables', {}).items():
-            for drop_type in ['guaranteedDrops', 'commonDrops', 'rareDrops', 'ultraRareDrops']:
+        for table_name, table in boss_tables.items():
+            for drop_type in BOSS_DROP_TYPES:
                 for idx, drop in enumerate(table.get(drop_type, [])):
                     if 'itemId' in drop:
                         check_item_ref(drop['itemId'], f"bossLootTables.{table_name}.{drop_type}[{idx}]")
 
     def validate_recipes(self):
         """Validate all recipe files."""
-        recipes_path = self.data_path / "Recipes"
-        if not recipes_path.exists():
-            return
-
-        for recipe_file in recipes_path.glob("*.json"):
-            file_path = f"Data/Recipes/{recipe_file.name}"
-            data = self.data.get(f'recipes_{recipe_file.stem}', {})
-
-            for category, recipes in data.items():
-                if not isinstance(recipes, list):
-                    continue
+        for name, entries in self._recipe_files:
+            file_path = f"Data/Recipes/{name}"
 
-                for idx, recipe in enumerate(recipes):
-                    if not isinstance(recipe, dict):
-                        continue
+            # Item references in this file that are not known items; when
+            # there are none the per-input/output checks are skipped
+            unknown = {
+                ref.get('itemId') for _, _, recipe in entries
+                for ref in recipe.get('inputs', []) + recipe.get('outputs', []) if ref.get('itemId')
+            } - self.item_ids
 
-                    recipe_id = recipe.get('id', 'unknown')
+            for category, idx, recipe in entries:
+                recipe_id = recipe.get('id', 'unknown')
 
+                if unknown:
                     # Check inputs reference valid items
                     for input_idx, input_item in enumerate(recipe.get('inputs', [])):
                         item_id = input_item.get('itemId', '')
-                        if item_id and item_id not in self.item_ids:
+                        if item_id in unknown:
                             self.report.add(ValidationResult(
                                 file=file_path,
                                 message=f"Unknown input item: {item_id}",
@@ -387,7 +560,7 @@ class GameDataValidator:
                     # Check outputs reference valid items
                     for output_idx, output_item in enumerate(recipe.get('outputs', [])):
                         item_id = output_item.get('itemId', '')
-                        if item_id and item_id not in self.item_ids:
+                        if item_id in unknown:
                             self.report.add(ValidationResult(
                                 file=file_path,
                                 message=f"Unknown output item: {item_id}",
@@ -396,16 +569,16 @@ class GameDataValidator:
                                 suggestion=f"Recipe: {recipe_id}"
                             ))
 
-                    # Validate skill level
-                    level = recipe.get('level', 0)
-                    if not isinstance(level, int) or level < 1 or level > 99:
-                        self.report.add(ValidationResult(
-                            file=file_path,
-                            message=f"Invalid skill level: {level}",
-                            severity=Severity.ERROR,
-                            path=f"{category}[{idx}].level",
-                            suggestion=f"Recipe: {recipe_id}. Level must be 1-99"
-                        ))
+                # Validate skill level
+                level = recipe.get('level', 0)
+                if not isinstance(level, int) or level < 1 or level > 99:
+                    self.report.add(ValidationResult(
+                        file=file_path,
+                        message=f"Invalid skill level: {level}",
+                        severity=Severity.ERROR,
+                        path=f"{category}[{idx}].level",
+                        suggestion=f"Recipe: {recipe_id}. Level must be 1-99"
+                    ))
 
     def validate_quests(self):
         """Validate quests.json structure and references."""
@@ -415,42 +588,50 @@ class GameDataValidator:
         quests_data = self.data['quests']
         file_path = "Data/Quests/quests.json"
         seen_ids = set()
-
-        for idx, quest in enumerate(quests_data.get('quests', [])):
+        quests = quests_data.get('quests', [])
+
+        # Unknown references across all quests, found with set differences;
+        # the per-quest reference loops only run when there are some
+        unknown_quests = {
+            req for quest in quests for req in quest.get('requirements', {}).get('quests', [])
+        } - self.quest_ids
+        unknown_items = {
+            reward.get('itemId') for quest in quests
+            for reward in quest.get('rewards', {}).get('items', []) if reward.get('itemId')
+        } - self.item_ids
+
+        for idx, quest in enumerate(quests):
             quest_id = quest.get('id', '')
 
             # Check for duplicate IDs
             if quest_id in seen_ids:
-                self.report.add(ValidationResult(
-                    file=file_path,
-                    message=f"Duplicate quest ID: {quest_id}",
-                    severity=Severity.ERROR,
-                    path=f"quests[{idx}]"
-                ))
+                self._report_duplicate(file_path, "quest", quest_id, f"quests[{idx}]")
             seen_ids.add(quest_id)
 
             # Validate requirements reference valid quests
-            for req_idx, req in enumerate(quest.get('requirements', {}).get('quests', [])):
-                if req not in self.quest_ids:
-                    self.report.add(ValidationResult(
-                        file=file_path,
-                        message=f"Unknown quest requirement: {req}",
-                        severity=Severity.WARNING,
-                        path=f"quests[{idx}].requirements.quests[{req_idx}]",
-                        suggestion=f"Quest: {quest_id}"
-                    ))
+            if unknown_quests:
+                for req_idx, req in enumerate(quest.get('requirements', {}).get('quests', [])):
+                    if req in unknown_quests:
+                        self.report.add(ValidationResult(
+                            file=file_path,
+                            message=f"Unknown quest requirement: {req}",
+                            severity=Severity.WARNING,
+                            path=f"quests[{idx}].requirements.quests[{req_idx}]",
+                            suggestion=f"Quest: {quest_id}"
+                        ))
 
             # Validate rewards reference valid items
-            for reward_idx, reward in enumerate(quest.get('rewards', {}).get('items', [])):
-                item_id = reward.get('itemId', '')
-                if item_id and item_id not in self.item_ids:
-                    self.report.add(ValidationResult(
-                        file=file_path,
-                        message=f"Unknown reward item: {item_id}",
-                        severity=Severity.WARNING,
-                        path=f"quests[{idx}].rewards.items[{reward_idx}]",
-                        suggestion=f"Quest: {quest_id}"
-                    ))
+            if unknown_items:
+                for reward_idx, reward in enumerate(quest.get('rewards', {}).get('items', [])):
+                    item_id = reward.get('itemId', '')
+                    if item_id in unknown_items:
+                        self.report.add(ValidationResult(
+                            file=file_path,
+                            message=f"Unknown reward item: {item_id}",
+                            severity=Severity.WARNING,
+                            path=f"quests[{idx}].rewards.items[{reward_idx}]",
+                            suggestion=f"Quest: {quest_id}"
+                        ))
 
     def validate_achievements(self):
         """Validate achievements.json structure and references."""
@@ -461,20 +642,19 @@ class GameDataValidator:
         file_path = "Data/Achievements/achievements.json"
         seen_ids = set()
 
-        valid_tiers = achievements_data.get('tiers', {}).keys()
-        valid_categories = [c['id'] for c in achievements_data.get('categories', [])]
+        tiers = achievements_data.get('tiers', {})
+        categories = [c['id'] for c in achievements_data.get('categories', [])]
+        valid_tiers = set(tiers)
+        valid_categories = set(categories)
+        tiers_suggestion = f"Valid tiers: {', '.join(tiers)}"
+        categories_suggestion = f"Valid categories: {', '.join(categories)}"
 
         for idx, achievement in enumerate(achievements_data.get('achievements', [])):
             ach_id = achievement.get('id', '')
 
             # Check for duplicate IDs
             if ach_id in seen_ids:
-                self.report.add(ValidationResult(
-                    file=file_path,
-                    message=f"Duplicate achievement ID: {ach_id}",
-                    severity=Severity.ERROR,
-                    path=f"achievements[{idx}]"
-                ))
+                self._report_duplicate(file_path, "achievement", ach_id, f"achievements[{idx}]")
             seen_ids.add(ach_id)
 
             # Validate tier
@@ -485,7 +665,7 @@ class GameDataValidator:
                     message=f"Invalid tier: {tier}",
                     severity=Severity.ERROR,
                     path=f"achievements[{idx}].tier",
-                    suggestion=f"Valid tiers: {', '.join(valid_tiers)}"
+                    suggestion=tiers_suggestion
                 ))
 
             # Validate category
@@ -496,7 +676,7 @@ class GameDataValidator:
                     message=f"Invalid category: {category}",
                     severity=Severity.ERROR,
                     path=f"achievements[{idx}].category",
-                    suggestion=f"Valid categories: {', '.join(valid_categories)}"
+                    suggestion=categories_suggestion
                 ))
 
     def validate_zones(self):
@@ -514,23 +694,11 @@ class GameDataValidator:
 
                 # Check for duplicate IDs
                 if zone_id in seen_ids:
-                    self.report.add(ValidationResult(
-                        file=file_path,
-                        message=f"Duplicate zone ID: {zone_id}",
-                        severity=Severity.ERROR,
-                        path=f"regions[{region_idx}].zones[{zone_idx}]"
-                    ))
+                    self._report_duplicate(file_path, "zone", zone_id, f"regions[{region_idx}].zones[{zone_idx}]")
                 seen_ids.add(zone_id)
 
-                # Validate connections reference valid zones
-                for conn in zone.get('connections', []):
-                    # This is a bit tricky since we're iterating while collecting
-                    pass  # Will be validated in second pass
-
-        # Second pass: validate connections
-        for region in zones_data.get('regions', []):
-            for zone in region.get('zones', []):
-                zone_id = zone.get('id', '')
+                # Validate connections reference valid zones; every zone ID
+                # was already gathered by collect_ids
                 for conn_idx, conn in enumerate(zone.get('connections', [])):
                     if conn not in self.zone_ids:
                         self.report.add(ValidationResult(
@@ -550,76 +718,100 @@ class GameDataValidator:
               f"{len(self.zone_ids)} zones, {len(self.quest_ids)} quests")
 
         print("\nValidating data files...")
-        self.validate_items()
-        self.validate_enemies()
-        self.validate_loot_tables()
-        self.validate_recipes()
-        self.validate_quests()
-        self.validate_achievements()
-        self.validate_zones()
+        validators = [
+            GameDataValidator.validate_items,
+            GameDataValidator.validate_enemies,
+            GameDataValidator.validate_loot_tables,
+            GameDataValidator.validate_recipes,
+            GameDataValidator.validate_quests,
+            GameDataValidator.validate_achievements,
+            GameDataValidator.validate_zones,
+        ]
+        with ThreadPoolExecutor(max_workers=min(VALIDATOR_THREADS, len(validators))) as pool:
+            # Merged in the order above, so the report matches a serial run
+            for results in pool.map(self._run_validator, validators):
+                for result in results:
+                    self.report.add(result)
 
         return self.report
 
+    def _run_validator(self, validator) -> List[ValidationResult]:
+        """Run one validate_* pass against its own report and return its results.
+
+        The copy shares the loaded data and frozen ID sets, which the passes
+        only read, so passes can run on separate threads without a lock.
+        """
+        worker = copy.copy(self)
+        worker.report = ValidationReport()
+        validator(worker)
+        return worker.report.results
+
     def print_report(self, verbose: bool = False):
         """Print the validation report."""
-        errors = [r for r in self.report.results if r.severity == Severity.ERROR]
-        warnings = [r for r in self.report.results if r.severity == Severity.WARNING]
-        infos = [r for r in self.report.results if r.severity == Severity.INFO]
+        if not self.report.results:
+            # Nothing to list, so skip the report frame entirely
+            print("\nAll validations passed!")
+            return 0
+
+        errors = self.report.errors
+        warnings = self.report.warnings
+        infos = self.report.infos
 
-        print("\n" + "=" * 60)
-        print("VALIDATION REPORT")
-        print("=" * 60)
+        # The header goes out straight away; the body is collected and
+        # written in one call, as printing each line is slow into a pipe
+        sys.stdout.write("\n" + "=" * 60 + "\nVALIDATION REPORT\n" + "=" * 60 + "\n")
+        sys.stdout.flush()
+        out = []
 
         if errors:
-            print(f"\nERRORS ({len(errors)}):")
-            print("-" * 40)
+            out.append(f"\nERRORS ({len(errors)}):\n" + "-" * 40 + "\n")
             for result in errors:
-                print(f"  [{result.file}]")
-                print(f"    {result.message}")
+                out.append(f"  [{result.file}]\n    {result.message}\n")
                 if result.path:
-                    print(f"    Path: {result.path}")
+                    out.append(f"    Path: {result.path}\n")
                 if result.suggestion:
-                    print(f"    Suggestion: {result.suggestion}")
-                print()
+                    out.append(f"    Suggestion: {result.suggestion}\n")
+                out.append("\n")
 
         if warnings:
-            print(f"\nWARNINGS ({len(warnings)}):")
-            print("-" * 40)
+            out.append(f"\nWARNINGS ({len(warnings)}):\n" + "-" * 40 + "\n")
             for result in warnings:
-                print(f"  [{result.file}]")
-                print(f"    {result.message}")
+                out.append(f"  [{result.file}]\n    {result.message}\n")
                 if result.path:
-                    print(f"    Path: {result.path}")
+                    out.append(f"    Path: {result.path}\n")
                 if verbose and result.suggestion:
-                    print(f"    Suggestion: {result.suggestion}")
-                print()
+                    out.append(f"    Suggestion: {result.suggestion}\n")
+                out.append("\n")
 
         if verbose and infos:
-            print(f"\nINFO ({len(infos)}):")
-            print("-" * 40)
+            out.append(f"\nINFO ({len(infos)}):\n" + "-" * 40 + "\n")
             for result in infos:
-                print(f"  [{result.file}] {result.message}")
+                out.append(f"  [{result.file}] {result.message}\n")
 
-        print("\n" + "=" * 60)
-        print(f"SUMMARY: {len(errors)} errors, {len(warnings)} warnings")
-        print("=" * 60)
+        out.append("\n" + "=" * 60 + "\n")
+        out.append(f"SUMMARY: {len(errors)} errors, {len(warnings)} warnings\n")
+        out.append("=" * 60 + "\n")
 
         if not errors and not warnings:
-            print("\nAll validations passed!")
-            return 0
+            out.append("\nAll validations passed!\n")
+            exit_code = 0
         elif errors:
-            print("\nValidation failed with errors.")
-            return 1
+            out.append("\nValidation failed with errors.\n")
+            exit_code = 1
         else:
-            print("\nValidation passed with warnings.")
-            return 0
+            out.append("\nValidation passed with warnings.\n")
+            exit_code = 0
 
+        sys.stdout.write(''.join(out))
+        return exit_code
 
 def main():
     parser = argparse.ArgumentParser(description='Validate Realm of Eternity game data')
     parser.add_argument('--data-path', default='Data', help='Path to Data directory')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--fix', action='store_true', help='Attempt to fix issues (not implemented)')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Reuse parsed data files from {DEFAULT_CACHE_DIR} while unchanged')
 
     args = parser.parse_args()
 
@@ -636,7 +828,7 @@ def main():
 
     print(f"Validating data in: {data_path.absolute()}")
 
-    validator = GameDataValidator(str(data_path))
+    validator = GameDataValidator(str(data_path), DEFAULT_CACHE_DIR if args.cache else None)
     validator.run_validation()
     exit_code = validator.print_report(verbose=args.verbose)
 
@@ -4,15 +4,242 @@ Realm of Eternity - Game Data Validator
 Validates all JSON data files against their schemas and cross-references.
 """
 
+import hashlib
+import importlib.util
 import json
+import operator
 import os
+import pickle
 import sys
 import re
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib parser
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional speedup, the per-field checks run on their own
+    fastjsonschema = None
+
+
+# One ValidationResult is made per finding, so it is slotted when the
+# interpreter supports it (dataclass slots= arrived in 3.10)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Recognised names; skills, biomes and difficulties are matched case-insensitively
+VALID_SKILLS = frozenset({
+    "attack", "strength", "defence", "ranged", "prayer", "magic",
+    "hitpoints", "crafting", "mining", "smithing", "fishing", "cooking",
+    "firemaking", "woodcutting", "runecrafting", "slayer", "farming",
+    "construction", "hunter", "summoning", "dungeoneering", "divination",
+    "invention", "archaeology", "agility", "herblore", "thieving", "fletching"
+})
+VALID_SLOTS = frozenset({"head", "cape", "neck", "ammo", "weapon", "shield",
+                         "body", "legs", "hands", "feet", "ring", "two_handed"})
+VALID_DIFFICULTIES = frozenset({"novice", "intermediate", "experienced", "master", "grandmaster"})
+VALID_BIOMES = frozenset({"temperate", "forest", "desert", "arctic", "swamp",
+                          "jungle", "volcanic", "coastal", "mountain", "plains"})
+
+
+def _number(minimum: float = None, maximum: float = None) -> Dict[str, Any]:
+    schema = {"type": "number"}
+    if minimum is not None:
+        schema["minimum"] = minimum
+    if maximum is not None:
+        schema["maximum"] = maximum
+    return schema
+
+
+# Shape rules of each data file, mirroring the per-field checks in
+# GameDataValidator. A file that passes its schema cannot fail those checks,
+# so they are skipped for it; a file that fails falls back to the per-field
+# checks, which report every problem rather than just the first. Skill,
+# difficulty and biome names are matched case-insensitively and checked
+# separately, along with cross-references.
+SHAPE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "items": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["id", "name"],
+                    "properties": {
+                        "equipment": {
+                            "type": "object",
+                            "properties": {
+                                "slot": {"enum": sorted(VALID_SLOTS)},
+                                "attack_bonus": {"type": ["number", "object"]},
+                                "strength_bonus": {"type": ["number", "object"]},
+                                "defence_bonus": {"type": ["number", "object"]},
+                            },
+                        },
+                        "requirements": {"type": "object", "additionalProperties": _number(1, 120)},
+                        "value": _number(0),
+                    },
+                },
+            },
+        },
+    },
+    "npcs": {
+        "type": "object",
+        "properties": {
+            "npcs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["id", "name"],
+                    "properties": {
+                        "combat_level": _number(1, 5000),
+                        "hitpoints": _number(1),
+                        "drops": {
+                            "type": "array",
+                            "items": {"type": "object", "properties": {"drop_rate": _number(0, 1)}},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    "skills": {
+        "type": "object",
+        "properties": {
+            "training_methods": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "level_required": _number(1, 120),
+                        "xp_per_action": _number(0),
+                    },
+                },
+            },
+        },
+    },
+    "quests": {
+        "type": "object",
+        "properties": {
+            "quests": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["id", "name", "difficulty"],
+                    "properties": {
+                        "difficulty": {"type": "string"},
+                        "quest_points": _number(1, 10),
+                        "requirements": {
+                            "type": "object",
+                            "properties": {"skills": {"type": "object"}, "quests": {"type": "array"}},
+                        },
+                        "stages": {
+                            "type": "array",
+                            "items": {"type": "object", "required": ["id", "description"]},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    "regions": {
+        "type": "object",
+        "properties": {
+            "regions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["id", "name"],
+                    "properties": {"biome": {"type": "string"}},
+                },
+            },
+        },
+    },
+    "bosses": {
+        "type": "object",
+        "properties": {
+            category: {
+                "additionalProperties": {
+                    "type": "object",
+                    "properties": {"combat_level": _number(1), "hitpoints": _number(1)},
+                },
+            }
+            for category in ["god_wars", "slayer_bosses", "raids", "solo_bosses"]
+        },
+    },
+}
+
+# --cache uses the same directory as Tools/validate_data.py; the schema_ and
+# outcome_ file name prefixes keep this script's entries apart from its own
+DEFAULT_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'roe-validator'
+
+
+def _replace_file(path: Path, data: bytes):
+    """Write ``data`` beside ``path`` and rename it over ``path``.
+
+    Concurrent runs and worker processes then see either the old file or
+    the new one, never a partly written one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _compiled_schema(kind: str, cache_dir: Optional[Path] = None):
+    """Return the compiled validator for SHAPE_SCHEMAS[kind], or None without fastjsonschema.
+
+    Each kind is compiled at most once per process. With a cache_dir the
+    generated code is also written there and imported by later runs, named
+    by a hash of the schema and library version so stale code is never used.
+    """
+    if fastjsonschema is None:
+        return None
+    schema = SHAPE_SCHEMAS[kind]
+    if cache_dir is None:
+        return fastjsonschema.compile(schema)
+
+    key = hashlib.blake2b(f"{fastjsonschema.VERSION}:{json.dumps(schema, sort_keys=True)}".encode('utf-8'),
+                          digest_size=16).hexdigest()
+    module_path = Path(cache_dir) / f"schema_{kind}_{key}.py"
+    try:
+        if not module_path.exists():
+            _replace_file(module_path, fastjsonschema.compile_to_code(schema).encode('utf-8'))
+        spec = importlib.util.spec_from_file_location(f"_roe_schema_{kind}", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.validate
+    except Exception:  # unwritable dir or unusable cached module: compile in memory
+        return fastjsonschema.compile(schema)
+
+# Location of a value in a data file: a dotted string, or a tuple of keys and
+# list indexes that is only rendered to one if a result is reported for it
+DataPath = Union[str, Tuple[Union[str, int], ...]]
+
+
+def render_path(path: Optional[DataPath]) -> Optional[str]:
+    """Render a tuple path such as ("items", 3, "value") as items[3].value."""
+    if not isinstance(path, tuple):
+        return path
+    rendered = ""
+    for part in path:
+        if type(part) is int:
+            rendered += f"[{part}]"
+        else:
+            rendered += f".{part}" if rendered else part
+    return rendered
+
 
 class Severity(Enum):
     ERROR = "ERROR"
@@ -20,7 +247,7 @@ class Severity(Enum):
     INFO = "INFO"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     file: str
     severity: Severity
@@ -32,8 +259,10 @@ class ValidationResult:
 class GameDataValidator:
     """Validates game data files for consistency and correctness."""
 
-    def __init__(self, data_root: Path):
+    def __init__(self, data_root: Path, cache_dir: Optional[Path] = None):
         self.data_root = data_root
+        # Generated schema validator code is reused from here across runs
+        self.cache_dir = cache_dir
         self.results: List[ValidationResult] = []
         self.items: Dict[str, Any] = {}
         self.npcs: Dict[str, Any] = {}
@@ -42,35 +271,53 @@ class GameDataValidator:
         self.regions: Dict[str, Any] = {}
         self.bosses: Dict[str, Any] = {}
 
-    def add_error(self, file: str, message: str, path: str = None):
-        self.results.append(ValidationResult(file, Severity.ERROR, message, path=path))
+    def add_error(self, file: str, message: str, path: DataPath = None):
+        self.results.append(ValidationResult(file, Severity.ERROR, message, path=render_path(path)))
 
-    def add_warning(self, file: str, message: str, path: str = None):
-        self.results.append(ValidationResult(file, Severity.WARNING, message, path=path))
+    def add_warning(self, file: str, message: str, path: DataPath = None):
+        self.results.append(ValidationResult(file, Severity.WARNING, message, path=render_path(path)))
 
-    def add_info(self, file: str, message: str, path: str = None):
-        self.results.append(ValidationResult(file, Severity.INFO, message, path=path))
+    def add_info(self, file: str, message: str, path: DataPath = None):
+        self.results.append(ValidationResult(file, Severity.INFO, message, path=render_path(path)))
 
     def load_json(self, filepath: Path) -> Optional[Dict]:
         """Load and parse a JSON file."""
         try:
+            if orjson is not None:
+                return orjson.loads(filepath.read_bytes())
             with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson's error subclasses it
             self.add_error(str(filepath), f"Invalid JSON: {e}")
             return None
         except FileNotFoundError:
             self.add_error(str(filepath), "File not found")
             return None
 
-    def validate_required_fields(self, data: Dict, required: List[str], file: str, path: str = ""):
-        """Check that all required fields are present."""
-        for field in required:
-            if field not in data:
-                self.add_error(file, f"Missing required field: {field}", path)
+    def matches_schema(self, kind: str, data: Any) -> bool:
+        """Check data against the compiled shape schema for its kind of file."""
+        validate = _compiled_schema(kind, self.cache_dir)
+        if validate is None:
+            return False
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    def validate_required_fields(self, data: Dict, required: Sequence[str], file: str,
+                                 path: DataPath = "") -> List[str]:
+        """Check that all required fields are present, returning the missing ones."""
+        missing = [field for field in required if field not in data]
+        for field in missing:
+            self.add_error(file, f"Missing required field: {field}", path)
+        return missing
 
-    def validate_string_field(self, value: Any, file: str, field: str, min_len: int = 1, max_len: int = 1000):
+    def validate_string_field(self, value: Any, file: str, field: DataPath, min_len: int = 1, max_len: int = 1000):
         """Validate a string field."""
+        if isinstance(value, str) and min_len <= len(value) <= max_len:
+            return True
+        field = render_path(field)
         if not isinstance(value, str):
             self.add_error(file, f"{field} must be a string", field)
             return False
@@ -82,9 +329,13 @@ class GameDataValidator:
             return False
         return True
 
-    def validate_number_field(self, value: Any, file: str, field: str,
+    def validate_number_field(self, value: Any, file: str, field: DataPath,
                                min_val: float = None, max_val: float = None):
         """Validate a numeric field."""
+        if (isinstance(value, (int, float)) and (min_val is None or value >= min_val)
+                and (max_val is None or value <= max_val)):
+            return True
+        field = render_path(field)
         if not isinstance(value, (int, float)):
             self.add_error(file, f"{field} must be a number", field)
             return False
@@ -96,26 +347,20 @@ class GameDataValidator:
             return False
         return True
 
-    def validate_item_reference(self, item_id: str, file: str, path: str):
+    def validate_item_reference(self, item_id: str, file: str, path: DataPath):
         """Validate that an item ID exists in the items database."""
         if item_id not in self.items:
             self.add_warning(file, f"Unknown item reference: {item_id}", path)
 
-    def validate_npc_reference(self, npc_id: str, file: str, path: str):
+    def validate_npc_reference(self, npc_id: str, file: str, path: DataPath):
         """Validate that an NPC ID exists in the NPC database."""
         if npc_id not in self.npcs:
             self.add_warning(file, f"Unknown NPC reference: {npc_id}", path)
 
-    def validate_skill_reference(self, skill_name: str, file: str, path: str):
+    def validate_skill_reference(self, skill_name: str, file: str, path: DataPath):
         """Validate that a skill name is valid."""
-        valid_skills = {
-            "attack", "strength", "defence", "ranged", "prayer", "magic",
-            "hitpoints", "crafting", "mining", "smithing", "fishing", "cooking",
-            "firemaking", "woodcutting", "runecrafting", "slayer", "farming",
-            "construction", "hunter", "summoning", "dungeoneering", "divination",
-            "invention", "archaeology", "agility", "herblore", "thieving", "fletching"
-        }
-        if skill_name.lower() not in valid_skills:
+        # Most names are already lowercase, so try them as they are first
+        if skill_name not in VALID_SKILLS and skill_name.lower() not in VALID_SKILLS:
             self.add_error(file, f"Invalid skill reference: {skill_name}", path)
 
     def validate_items_file(self, filepath: Path) -> bool:
@@ -129,41 +374,53 @@ class GameDataValidator:
         if "items" not in data:
             self.add_error(file, "Missing 'items' array")
             return False
-
-        for i, item in enumerate(data.get("items", [])):
-            path = f"items[{i}]"
-
-            # Required fields
-            self.validate_required_fields(item, ["id", "name"], file, path)
-
-            if "id" in item:
-                self.items[item["id"]] = item
-
-            # Validate equipment stats if present
-            if "equipment" in item:
-                equip = item["equipment"]
-                if "slot" in equip:
-                    valid_slots = {"head", "cape", "neck", "ammo", "weapon", "shield",
-                                   "body", "legs", "hands", "feet", "ring", "two_handed"}
-                    if equip["slot"] not in valid_slots:
-                        self.add_error(file, f"Invalid equipment slot: {equip['slot']}", f"{path}.equipment.slot")
-
-                # Validate stat bonuses
-                for stat in ["attack_bonus", "strength_bonus", "defence_bonus"]:
-                    if stat in equip and not isinstance(equip[stat], (int, float, dict)):
-                        self.add_error(file, f"Invalid {stat} format", f"{path}.equipment.{stat}")
-
-            # Validate requirements
-            if "requirements" in item:
-                for skill, level in item["requirements"].items():
-                    self.validate_skill_reference(skill, file, f"{path}.requirements")
-                    self.validate_number_field(level, file, f"{path}.requirements.{skill}", 1, 120)
-
-            # Validate value
-            if "value" in item:
-                self.validate_number_field(item["value"], file, f"{path}.value", 0)
-
-        self.add_info(file, f"Validated {len(data.get('items', []))} items")
+        item_list = data["items"]
+
+        if self.matches_schema("items", data):
+            # Shapes are all valid, leaving IDs and skill names to handle;
+            # names resolved once here keep lookups out of the loop
+            valid_skills, check_skill = VALID_SKILLS, self.validate_skill_reference
+            # Every item has an ID here, so the table is filled in one C-level update
+            self.items.update(zip(map(operator.itemgetter("id"), item_list), item_list))
+            for i, item in enumerate(item_list):
+                requirements = item.get("requirements")
+                # One set difference finds whether any name needs a closer look
+                if requirements and requirements.keys() - valid_skills:
+                    for skill in requirements:
+                        check_skill(skill, file, ("items", i, "requirements"))
+        else:
+            for i, item in enumerate(item_list):
+                path = ("items", i)
+
+                # Required fields
+                missing = self.validate_required_fields(item, ("id", "name"), file, path)
+
+                if "id" not in missing:
+                    self.items[item["id"]] = item
+
+                # Validate equipment stats if present
+                if "equipment" in item:
+                    equip = item["equipment"]
+                    if "slot" in equip:
+                        if equip["slot"] not in VALID_SLOTS:
+                            self.add_error(file, f"Invalid equipment slot: {equip['slot']}", path + ("equipment", "slot"))
+
+                    # Validate stat bonuses
+                    for stat in ["attack_bonus", "strength_bonus", "defence_bonus"]:
+                        if stat in equip and not isinstance(equip[stat], (int, float, dict)):
+                            self.add_error(file, f"Invalid {stat} format", path + ("equipment", stat))
+
+                # Validate requirements
+                if "requirements" in item:
+                    for skill, level in item["requirements"].items():
+                        self.validate_skill_reference(skill, file, path + ("requirements",))
+                        self.validate_number_field(level, file, path + ("requirements", skill), 1, 120)
+
+                # Validate value
+                if "value" in item:
+                    self.validate_number_field(item["value"], file, path + ("value",), 0)
+
+        self.add_info(file, f"Validated {len(item_list)} items")
         return True
 
     def validate_npcs_file(self, filepath: Path) -> bool:
@@ -173,32 +430,44 @@ class GameDataValidator:
             return False
 
         file = str(filepath)
-
-        for i, npc in enumerate(data.get("npcs", [])):
-            path = f"npcs[{i}]"
-
-            self.validate_required_fields(npc, ["id", "name"], file, path)
-
-            if "id" in npc:
-                self.npcs[npc["id"]] = npc
-
-            # Validate combat stats if present
-            if "combat_level" in npc:
-                self.validate_number_field(npc["combat_level"], file, f"{path}.combat_level", 1, 5000)
-
-            if "hitpoints" in npc:
-                self.validate_number_field(npc["hitpoints"], file, f"{path}.hitpoints", 1)
-
-            # Validate drops
-            if "drops" in npc:
-                for j, drop in enumerate(npc["drops"]):
-                    drop_path = f"{path}.drops[{j}]"
-                    if "item_id" in drop:
-                        self.validate_item_reference(drop["item_id"], file, drop_path)
-                    if "drop_rate" in drop:
-                        self.validate_number_field(drop["drop_rate"], file, f"{drop_path}.drop_rate", 0, 1)
-
-        self.add_info(file, f"Validated {len(data.get('npcs', []))} NPCs")
+        npc_list = data.get("npcs", [])
+
+        if self.matches_schema("npcs", data):
+            # Shapes are all valid, leaving IDs and item references to handle;
+            # known items are the common case, so test for them before
+            # building a path for the warning
+            items = self.items
+            self.npcs.update(zip(map(operator.itemgetter("id"), npc_list), npc_list))
+            for i, npc in enumerate(npc_list):
+                for j, drop in enumerate(npc.get("drops", [])):
+                    if "item_id" in drop and drop["item_id"] not in items:
+                        self.validate_item_reference(drop["item_id"], file, ("npcs", i, "drops", j))
+        else:
+            for i, npc in enumerate(npc_list):
+                path = ("npcs", i)
+
+                missing = self.validate_required_fields(npc, ("id", "name"), file, path)
+
+                if "id" not in missing:
+                    self.npcs[npc["id"]] = npc
+
+                # Validate combat stats if present
+                if "combat_level" in npc:
+                    self.validate_number_field(npc["combat_level"], file, path + ("combat_level",), 1, 5000)
+
+                if "hitpoints" in npc:
+                    self.validate_number_field(npc["hitpoints"], file, path + ("hitpoints",), 1)
+
+                # Validate drops
+                if "drops" in npc:
+                    for j, drop in enumerate(npc["drops"]):
+                        drop_path = path + ("drops", j)
+                        if "item_id" in drop and drop["item_id"] not in self.items:
+                            self.validate_item_reference(drop["item_id"], file, drop_path)
+                        if "drop_rate" in drop:
+                            self.validate_number_field(drop["drop_rate"], file, drop_path + ("drop_rate",), 0, 1)
+
+        self.add_info(file, f"Validated {len(npc_list)} NPCs")
         return True
 
     def validate_skills_file(self, filepath: Path) -> bool:
@@ -215,7 +484,10 @@ class GameDataValidator:
             xp_table = data["xp_table"]
             if not isinstance(xp_table, list):
                 self.add_error(file, "xp_table must be an array")
-            else:
+            # A table of non-decreasing ints from 0 is confirmed without a
+            # Python-level loop; otherwise the bad levels are found one by one
+            elif not ({int}.issuperset(map(type, xp_table))
+                      and all(map(operator.le, [0] + xp_table, xp_table))):
                 prev_xp = 0
                 for i, xp in enumerate(xp_table):
                     if not isinstance(xp, int) or xp < prev_xp:
@@ -223,13 +495,13 @@ class GameDataValidator:
                     prev_xp = xp
 
         # Validate training methods if present
-        if "training_methods" in data:
+        if "training_methods" in data and not self.matches_schema("skills", data):
             for i, method in enumerate(data["training_methods"]):
-                path = f"training_methods[{i}]"
+                path = ("training_methods", i)
                 if "level_required" in method:
-                    self.validate_number_field(method["level_required"], file, f"{path}.level_required", 1, 120)
+                    self.validate_number_field(method["level_required"], file, path + ("level_required",), 1, 120)
                 if "xp_per_action" in method:
-                    self.validate_number_field(method["xp_per_action"], file, f"{path}.xp_per_action", 0)
+                    self.validate_number_field(method["xp_per_action"], file, path + ("xp_per_action",), 0)
 
         self.add_info(file, f"Validated {skill_name} skill file")
         return True
@@ -241,46 +513,65 @@ class GameDataValidator:
             return False
 
         file = str(filepath)
-
-        for i, quest in enumerate(data.get("quests", [])):
-            path = f"quests[{i}]"
-
-            self.validate_required_fields(quest, ["id", "name", "difficulty"], file, path)
-
-            if "id" in quest:
-                self.quests[quest["id"]] = quest
-
-            # Validate difficulty
-            if "difficulty" in quest:
-                valid_difficulties = {"novice", "intermediate", "experienced", "master", "grandmaster"}
-                if quest["difficulty"].lower() not in valid_difficulties:
-                    self.add_error(file, f"Invalid difficulty: {quest['difficulty']}", f"{path}.difficulty")
-
-            # Validate quest points
-            if "quest_points" in quest:
-                self.validate_number_field(quest["quest_points"], file, f"{path}.quest_points", 1, 10)
-
-            # Validate requirements
-            if "requirements" in quest:
-                reqs = quest["requirements"]
-                if "skills" in reqs:
-                    for skill, level in reqs["skills"].items():
-                        self.validate_skill_reference(skill, file, f"{path}.requirements.skills")
-                if "quests" in reqs:
-                    for req_quest in reqs["quests"]:
-                        if req_quest not in self.quests and req_quest != quest.get("id"):
-                            self.add_warning(file, f"Unknown quest requirement: {req_quest}",
-                                           f"{path}.requirements.quests")
-
-            # Validate stages
-            if "stages" in quest:
-                for j, stage in enumerate(quest["stages"]):
-                    stage_path = f"{path}.stages[{j}]"
-                    self.validate_required_fields(stage, ["id", "description"], file, stage_path)
-
-        self.add_info(file, f"Validated {len(data.get('quests', []))} quests")
+        quest_list = data.get("quests", [])
+
+        if self.matches_schema("quests", data):
+            # Shapes are all valid, leaving IDs, names and references to handle
+            quests = self.quests
+            check_difficulty = self.validate_quest_difficulty
+            check_requirements = self.validate_quest_requirements
+            for i, quest in enumerate(quest_list):
+                path = ("quests", i)
+                quests[quest["id"]] = quest
+                check_difficulty(quest, file, path)
+                check_requirements(quest, file, path)
+        else:
+            for i, quest in enumerate(quest_list):
+                path = ("quests", i)
+
+                missing = self.validate_required_fields(quest, ("id", "name", "difficulty"), file, path)
+
+                if "id" not in missing:
+                    self.quests[quest["id"]] = quest
+
+                self.validate_quest_difficulty(quest, file, path)
+
+                # Validate quest points
+                if "quest_points" in quest:
+                    self.validate_number_field(quest["quest_points"], file, path + ("quest_points",), 1, 10)
+
+                self.validate_quest_requirements(quest, file, path)
+
+                # Validate stages
+                if "stages" in quest:
+                    for j, stage in enumerate(quest["stages"]):
+                        stage_path = path + ("stages", j)
+                        self.validate_required_fields(stage, ("id", "description"), file, stage_path)
+
+        self.add_info(file, f"Validated {len(quest_list)} quests")
         return True
 
+    def validate_quest_difficulty(self, quest: Dict, file: str, path: DataPath):
+        """Validate that a quest's difficulty is a known one."""
+        if "difficulty" in quest:
+            if quest["difficulty"].lower() not in VALID_DIFFICULTIES:
+                self.add_error(file, f"Invalid difficulty: {quest['difficulty']}", path + ("difficulty",))
+
+    def validate_quest_requirements(self, quest: Dict, file: str, path: DataPath):
+        """Validate the skills and quests a quest requires."""
+        if "requirements" in quest:
+            reqs = quest["requirements"]
+            # Names that are not valid as written are rare, so look for any
+            # with one set difference before checking them one by one
+            if "skills" in reqs and reqs["skills"].keys() - VALID_SKILLS:
+                for skill in reqs["skills"]:
+                    self.validate_skill_reference(skill, file, path + ("requirements", "skills"))
+            if "quests" in reqs:
+                for req_quest in reqs["quests"]:
+                    if req_quest not in self.quests and req_quest != quest.get("id"):
+                        self.add_warning(file, f"Unknown quest requirement: {req_quest}",
+                                       path + ("requirements", "quests"))
+
     def validate_regions_file(self, filepath: Path) -> bool:
         """Validate world regions file."""
         data = self.load_json(filepath)
@@ -288,23 +579,24 @@ class GameDataValidator:
             return False
 
         file = str(filepath)
+        region_list = data.get("regions", [])
+        shapes_valid = self.matches_schema("regions", data)
 
-        for i, region in enumerate(data.get("regions", [])):
-            path = f"regions[{i}]"
+        for i, region in enumerate(region_list):
+            path = ("regions", i)
 
-            self.validate_required_fields(region, ["id", "name"], file, path)
+            # A valid shape already guarantees the required fields
+            missing = () if shapes_valid else self.validate_required_fields(region, ("id", "name"), file, path)
 
-            if "id" in region:
+            if "id" not in missing:
                 self.regions[region["id"]] = region
 
             # Validate biome if present
             if "biome" in region:
-                valid_biomes = {"temperate", "forest", "desert", "arctic", "swamp",
-                               "jungle", "volcanic", "coastal", "mountain", "plains"}
-                if region["biome"].lower() not in valid_biomes:
-                    self.add_warning(file, f"Unknown biome: {region['biome']}", f"{path}.biome")
+                if region["biome"].lower() not in VALID_BIOMES:
+                    self.add_warning(file, f"Unknown biome: {region['biome']}", path + ("biome",))
 
-        self.add_info(file, f"Validated {len(data.get('regions', []))} regions")
+        self.add_info(file, f"Validated {len(region_list)} regions")
         return True
 
     def validate_bosses_file(self, filepath: Path) -> bool:
@@ -314,28 +606,30 @@ class GameDataValidator:
             return False
 
         file = str(filepath)
+        shapes_valid = self.matches_schema("bosses", data)
 
         for category in ["god_wars", "slayer_bosses", "raids", "solo_bosses"]:
             if category in data:
                 bosses = data[category]
                 if isinstance(bosses, dict):
                     for boss_id, boss in bosses.items():
-                        path = f"{category}.{boss_id}"
+                        path = (category, boss_id)
                         self.bosses[boss_id] = boss
 
-                        if "combat_level" in boss:
-                            self.validate_number_field(boss["combat_level"], file,
-                                                      f"{path}.combat_level", 1)
-                        if "hitpoints" in boss:
-                            self.validate_number_field(boss["hitpoints"], file,
-                                                      f"{path}.hitpoints", 1)
+                        if not shapes_valid:
+                            if "combat_level" in boss:
+                                self.validate_number_field(boss["combat_level"], file,
+                                                          path + ("combat_level",), 1)
+                            if "hitpoints" in boss:
+                                self.validate_number_field(boss["hitpoints"], file,
+                                                          path + ("hitpoints",), 1)
 
                         # Validate drops
                         if "drops" in boss:
                             for j, drop in enumerate(boss["drops"]):
-                                if "item_id" in drop:
+                                if "item_id" in drop and drop["item_id"] not in self.items:
                                     self.validate_item_reference(drop["item_id"], file,
-                                                                f"{path}.drops[{j}]")
+                                                                path + ("drops", j))
 
         self.add_info(file, f"Validated {len(self.bosses)} bosses")
         return True
@@ -363,75 +657,131 @@ class GameDataValidator:
             for class_name, class_data in classes.items():
                 if "volume" in class_data:
                     self.validate_number_field(class_data["volume"], file,
-                                              f"sound_classes.{class_name}.volume", 0, 1)
+                                              ("sound_classes", class_name, "volume"), 0, 1)
 
         self.add_info(file, "Validated audio specification")
         return True
 
+    def validate_files(self, tasks: List[Tuple[str, Path]], workers: int):
+        """Run (method name, file) tasks and merge their results and collected IDs.
+
+        With more than one worker and task, files are validated in worker
+        processes. Files that check item references wait for the items file
+        and get its item IDs; everything else starts at once. With a
+        cache_dir, files whose outcome is cached for their current contents
+        are not validated again. Results are merged in task order either way.
+        """
+        outcomes = {}
+        digests = {}
+        if self.cache_dir is not None:
+            for method_name, filepath in tasks:
+                digests[filepath] = _file_digest(filepath)
+            items_digest = next((digests[f] for m, f in tasks if m == "validate_items_file"), "")
+            for method_name, filepath in tasks:
+                if method_name in _NEEDS_ITEMS:
+                    # Their warnings depend on which items exist
+                    digests[filepath] += f":{items_digest}"
+                outcomes[filepath] = _read_outcome(self._outcome_path(filepath), digests[filepath])
+
+        pending = [(m, f) for m, f in tasks if outcomes.get(f) is None]
+        parallel = workers > 1 and len(pending) > 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) if parallel else nullcontext() as pool:
+            def submit(method_name: str, filepath: Path, item_ids: Tuple[str, ...]) -> Future:
+                args = (self.data_root, self.cache_dir, method_name, filepath, item_ids)
+                if pool is not None:
+                    return pool.submit(_validate_file, *args)
+                future = Future()
+                future.set_result(_validate_file(*args))
+                return future
+
+            futures = {f: submit(m, f, ()) for m, f in pending if m not in _NEEDS_ITEMS}
+            for method_name, filepath in tasks:
+                if method_name == "validate_items_file":
+                    outcome = outcomes.get(filepath) or futures[filepath].result()
+                    self.items.update(dict.fromkeys(outcome[1] or ()))
+            item_ids = tuple(self.items)
+            futures.update((f, submit(m, f, item_ids)) for m, f in pending if m in _NEEDS_ITEMS)
+
+            for method_name, filepath in tasks:
+                if outcomes.get(filepath) is None:
+                    outcomes[filepath] = futures[filepath].result()
+                    if self.cache_dir is not None:
+                        _write_outcome(self._outcome_path(filepath), digests[filepath], outcomes[filepath])
+                results, ids = outcomes[filepath]
+                self.results.extend(results)
+                if ids:
+                    getattr(self, _COLLECTED[method_name]).update(dict.fromkeys(ids))
+
+    def _outcome_path(self, filepath: Path) -> Path:
+        """One cached outcome per data file, named by the path its results report."""
+        key = str(filepath).encode('utf-8')
+        return self.cache_dir / f"outcome_{hashlib.blake2b(key, digest_size=16).hexdigest()}.pkl"
+
     def cross_validate(self):
         """Perform cross-file validation checks."""
         # Check for orphaned references
         # Check for duplicate IDs
         # Check for circular dependencies in quests
 
-        all_ids = set()
-        duplicates = set()
-
-        for item_id in self.items:
-            if item_id in all_ids:
-                duplicates.add(item_id)
-            all_ids.add(item_id)
-
-        for npc_id in self.npcs:
-            if npc_id in all_ids:
-                duplicates.add(npc_id)
-            all_ids.add(npc_id)
+        # Each table is keyed by ID, so a count above one means the ID is
+        # shared between tables
+        id_counts = Counter(chain(self.items, self.npcs, self.quests, self.regions, self.bosses))
+        for duplicate, count in id_counts.items():
+            if count > 1:
+                self.add_error("cross-validation", f"Duplicate ID found: {duplicate}")
 
-        for duplicate in duplicates:
-            self.add_error("cross-validation", f"Duplicate ID found: {duplicate}")
+    def run_all_validations(self, workers: Optional[int] = None) -> Tuple[int, int, int]:
+        """Run all validations and return counts of errors, warnings, info.
 
-    def run_all_validations(self) -> Tuple[int, int, int]:
-        """Run all validations and return counts of errors, warnings, info."""
+        Files are validated in worker processes (one per CPU by default);
+        results are merged in the same order as a serial run.
+        """
 
         # Find and validate all relevant files
         data_dir = self.data_root / "Data"
         ue5_dir = self.data_root / "UE5"
+        tasks: List[Tuple[str, Path]] = []
 
         # Items
         items_file = data_dir / "Items" / "items.json"
-        if items_file.exists():
-            self.validate_items_file(items_file)
+        if os.path.isfile(items_file):
+            tasks.append(("validate_items_file", items_file))
 
         # NPCs
         npcs_file = data_dir / "NPCs" / "npcs.json"
-        if npcs_file.exists():
-            self.validate_npcs_file(npcs_file)
+        if os.path.isfile(npcs_file):
+            tasks.append(("validate_npcs_file", npcs_file))
 
         # Skills
+        # One directory scan; the entries' cached types avoid a stat per file
         skills_dir = data_dir / "Skills"
-        if skills_dir.exists():
-            for skill_file in skills_dir.glob("*.json"):
-                self.validate_skills_file(skill_file)
+        if skills_dir.is_dir():
+            with os.scandir(skills_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file():
+                        tasks.append(("validate_skills_file", skills_dir / entry.name))
 
         # Quests
         quests_file = data_dir / "Quests" / "quest_definitions.json"
-        if quests_file.exists():
-            self.validate_quests_file(quests_file)
+        if os.path.isfile(quests_file):
+            tasks.append(("validate_quests_file", quests_file))
 
         # Regions
         regions_file = data_dir / "World" / "regions.json"
-        if regions_file.exists():
-            self.validate_regions_file(regions_file)
+        if os.path.isfile(regions_file):
+            tasks.append(("validate_regions_file", regions_file))
 
         # Bosses
         bosses_file = data_dir / "Combat" / "bosses.json"
-        if bosses_file.exists():
-            self.validate_bosses_file(bosses_file)
+        if os.path.isfile(bosses_file):
+            tasks.append(("validate_bosses_file", bosses_file))
 
         # Audio spec
         audio_file = ue5_dir / "Specifications" / "AudioSoundDesignSpec.json"
-        if audio_file.exists():
-            self.validate_audio_spec(audio_file)
+        if os.path.isfile(audio_file):
+            tasks.append(("validate_audio_spec", audio_file))
+
+        self.validate_files(tasks, workers or os.cpu_count() or 1)
 
         # Cross-validation
         self.cross_validate()
@@ -445,18 +795,99 @@ class GameDataValidator:
 
     def print_results(self):
         """Print validation results to console."""
+        prefixes = {
+            Severity.ERROR: "\033[91mERROR\033[0m",
+            Severity.WARNING: "\033[93mWARNING\033[0m",
+            Severity.INFO: "\033[94mINFO\033[0m"
+        }
+        # Results are joined and written once rather than printed one by one
+        lines = []
+        append = lines.append
         for result in self.results:
-            prefix = {
-                Severity.ERROR: "\033[91mERROR\033[0m",
-                Severity.WARNING: "\033[93mWARNING\033[0m",
-                Severity.INFO: "\033[94mINFO\033[0m"
-            }[result.severity]
-
             location = result.file
             if result.path:
                 location += f" ({result.path})"
 
-            print(f"{prefix}: {location}: {result.message}")
+            append(f"{prefixes[result.severity]}: {location}: {result.message}\n")
+        sys.stdout.write("".join(lines))
+
+
+# Attribute each validate_*_file method fills with the entries it collects
+_COLLECTED = {
+    "validate_items_file": "items",
+    "validate_npcs_file": "npcs",
+    "validate_quests_file": "quests",
+    "validate_regions_file": "regions",
+    "validate_bosses_file": "bosses",
+}
+# Methods that check item references, so need the items file read first
+_NEEDS_ITEMS = {"validate_npcs_file", "validate_bosses_file"}
+
+
+@lru_cache(maxsize=None)
+def _validator_digest() -> str:
+    """Fingerprint of this script and the parser in use; cached outcomes must match it."""
+    source = Path(__file__).read_bytes()
+    return f"{hashlib.md5(source).hexdigest()}:{'orjson' if orjson is not None else 'json'}"
+
+
+def _file_digest(filepath: Path) -> str:
+    """Key a file's cached outcome by its exact contents and the validator version."""
+    return f"{_validator_digest()}:{hashlib.md5(filepath.read_bytes()).hexdigest()}"
+
+
+def _read_outcome(cache_path: Path, digest: str):
+    """Return the cached (results, collected IDs) for digest, or None if missing or stale."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_digest, outcome = pickle.load(f)
+    except Exception:  # not cached yet, or left by an interrupted or older run
+        return None
+    return outcome if cached_digest == digest else None
+
+
+def _write_outcome(cache_path: Path, digest: str, outcome):
+    """Cache a file's outcome under its digest, overwriting any older outcome."""
+    try:
+        _replace_file(cache_path, pickle.dumps((digest, outcome), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # an unwritable cache dir only means validating the file again next run
+
+
+def _validate_file(data_root: Path, cache_dir: Optional[Path], method_name: str,
+                   filepath: Path, item_ids: Tuple[str, ...]):
+    """Run one validate_* method on a fresh validator, in this or a worker process.
+
+    Returns the results and the IDs of the entries the method collected, if
+    any. Only the IDs go back to the parent, which never reads the entries
+    themselves, so the outcome stays small to pickle.
+    """
+    validator = GameDataValidator(data_root, cache_dir)
+    validator.items = dict.fromkeys(item_ids)
+    getattr(validator, method_name)(filepath)
+    collected = _COLLECTED.get(method_name)
+    return validator.results, tuple(getattr(validator, collected)) if collected else None
+
+
+def _encode(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode('utf-8')
+
+
+def write_json_report(fp, summary: Dict[str, int], results: List[ValidationResult]):
+    """Write the --json report to a binary stream one result at a time.
+
+    The output is the same as dumping the whole report with indent=2, but
+    no report-sized object is built first.
+    """
+    fp.write(b'{\n  "summary": ' + _encode(summary).replace(b"\n", b"\n  ") + b',\n  "results": [')
+    separator = b"\n    "
+    for r in results:
+        record = {"file": r.file, "severity": r.severity.value, "message": r.message, "path": r.path}
+        fp.write(separator + _encode(record).replace(b"\n", b"\n    "))
+        separator = b",\n    "
+    fp.write(b"]\n}\n" if not results else b"\n  ]\n}\n")
 
 
 def main():
@@ -470,30 +901,21 @@ def main():
                        help="Output results as JSON")
     parser.add_argument("--fail-on-warning", action="store_true",
                        help="Exit with error code on warnings")
+    parser.add_argument("--workers", type=int,
+                       help="Worker processes for validating files (default: one per CPU)")
+    parser.add_argument("--cache", action="store_true",
+                       help=f"Reuse compiled schemas and unchanged files' results from {DEFAULT_CACHE_DIR}")
 
     args = parser.parse_args()
 
-    validator = GameDataValidator(args.root)
-    errors, warnings, info = validator.run_all_validations()
+    validator = GameDataValidator(args.root, DEFAULT_CACHE_DIR if args.cache else None)
+    errors, warnings, info = validator.run_all_validations(args.workers)
 
     if args.json:
-        output = {
-            "summary": {
-                "errors": errors,
-                "warnings": warnings,
-                "info": info
-            },
-            "results": [
-                {
-                    "file": r.file,
-                    "severity": r.severity.value,
-                    "message": r.message,
-                    "path": r.path
-                }
-                for r in validator.results
-            ]
-        }
-        print(json.dumps(output, indent=2))
+        summary = {"errors": errors, "warnings": warnings, "info": info}
+        sys.stdout.flush()
+        write_json_report(sys.stdout.buffer, summary, validator.results)
+        sys.stdout.buffer.flush()
     else:
         validator.print_results()
         print(f"\nSummary: {errors} errors, {warnings} warnings, {info} info")